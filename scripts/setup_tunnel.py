@@ -1,4 +1,6 @@
 from pyngrok import ngrok
+import random
+import threading
 import time
 import logging
 
@@ -6,7 +8,66 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def setup_webhook_tunnel(port=8000):
+def _tunnel_is_up():
+    """Check whether ngrok reports at least one open tunnel."""
+    try:
+        return bool(ngrok.get_tunnels())
+    except Exception:
+        return False
+
+def reconnect_tunnel(port, max_attempts=10, base_delay=1.0, max_delay=30.0, pause=300.0):
+    """Reconnect the tunnel until ngrok reports it open again.
+
+    Reconnects use capped exponential backoff with jitter. After
+    `max_attempts` consecutive failures the loop pauses for `pause`
+    seconds before trying again, so a persistent outage is not hammered.
+    """
+    attempt = 0
+    while not _tunnel_is_up():
+        if attempt >= max_attempts:
+            logger.error(f"Tunnel still down after {attempt} attempts, pausing for {pause:.0f}s")
+            time.sleep(pause)
+            attempt = 0
+            continue
+
+        delay = min(max_delay, base_delay * 2 ** attempt) * random.uniform(0.5, 1.5)
+        attempt += 1
+        logger.warning(f"ngrok tunnel is down, reconnecting in {delay:.1f}s (attempt {attempt})")
+        time.sleep(delay)
+        try:
+            public_url = ngrok.connect(port, "http")
+            logger.info(f"Tunnel reconnected, update the webhook URL to: {public_url}/webhook")
+        except Exception as e:
+            logger.warning(f"Reconnect failed: {str(e)}")
+
+def keep_tunnel_alive(port, health_check_interval=60.0):
+    """Block until interrupted, reconnecting the tunnel when it drops.
+
+    The main thread waits on the ngrok process itself, so it wakes only
+    when ngrok exits. A background watchdog checks the tunnel list every
+    `health_check_interval` seconds to catch tunnels that close while the
+    process keeps running.
+    """
+    lock = threading.Lock()
+    stopped = threading.Event()
+
+    def watchdog():
+        while not stopped.wait(health_check_interval):
+            if not _tunnel_is_up():
+                with lock:
+                    reconnect_tunnel(port)
+
+    threading.Thread(target=watchdog, name="ngrok-watchdog", daemon=True).start()
+    try:
+        while True:
+            ngrok.get_ngrok_process().proc.wait()
+            logger.warning("ngrok process exited")
+            with lock:
+                reconnect_tunnel(port)
+    finally:
+        stopped.set()
+
+def setup_webhook_tunnel(port=8000, health_check_interval=60.0):
     """Set up ngrok tunnel for webhook testing."""
     try:
         # Start ngrok tunnel
@@ -32,9 +93,8 @@ def setup_webhook_tunnel(port=8000):
         print("\n6. Click 'Add webhook'")
         print("\nThe tunnel is now running. Press Ctrl+C to stop.")
         
-        # Keep the script running
-        while True:
-            time.sleep(1)
+        # Keep the script running and the tunnel connected
+        keep_tunnel_alive(port, health_check_interval)
             
     except KeyboardInterrupt:
         logger.info("\nShutting down ngrok tunnel...")
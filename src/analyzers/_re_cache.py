@@ -0,0 +1,19 @@
+"""Process-wide cache of compiled regular expressions for the analyzers."""
+import re
+from functools import lru_cache
+
+@lru_cache(maxsize=512)
+def compile_re(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compile a pattern once per process.
+
+    Unlike the implicit cache behind `re.search` and friends, entries here
+    are only evicted by LRU order, so rule patterns stay compiled across PRs.
+
+    Args:
+        pattern: Regular expression source
+        flags: Regex flags
+
+    Returns:
+        Compiled pattern
+    """
+    return re.compile(pattern, flags)
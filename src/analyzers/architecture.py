@@ -1,43 +1,114 @@
 """Architecture analyzer implementation."""
 import re
-from typing import List
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
 
-from src.analyzers.base import BaseAnalyzer
+from src.analyzers._re_cache import compile_re
+from src.analyzers.base import BaseAnalyzer, LineIndex, UnionPattern
+from src.core.config import scope_regex
 from src.core.models import Issue, IssueSeverity, PRContext
 
+@lru_cache(maxsize=256)
+def _scope_regex(scope_pattern: str) -> re.Pattern:
+    """Compile a rule scope, translating glob scopes such as ``*/controller/*``."""
+    return compile_re(scope_regex(scope_pattern))
+
+@lru_cache(maxsize=8192)
+def _scope_match(scope_pattern: str, file_path: str) -> bool:
+    """Check a rule scope against a path, memoized across files and PRs."""
+    return _scope_regex(scope_pattern).match(file_path) is not None
+
 class ArchitectureAnalyzer(BaseAnalyzer):
     """Analyzes code for architectural violations."""
 
+    def __init__(self, config, executor=None):
+        """Initialize analyzer and precompile architecture rules."""
+        super().__init__(config, executor)
+        architecture = self.config.rules.architecture
+        self._rules = [
+            *architecture.layer_violations,
+            *architecture.dependency_rules,
+            *architecture.pattern_violations,
+        ]
+        # Indexed like self._rules, since rule names need not be unique. Rules
+        # are written against single lines, so ^ and $ anchor at line breaks
+        self._compiled = [compile_re(rule.pattern, re.MULTILINE | re.ASCII) for rule in self._rules]
+        # Combined patterns keyed by the group names of the rules in scope for a file
+        self._combined: Dict[Tuple[str, ...], UnionPattern] = {}
+
     async def analyze(self, context: PRContext) -> List[Issue]:
         """Analyze PR for architectural violations."""
-        issues = []
-        rules = self.config.rules.architecture
+        return await self._scan_files(context)
 
-        for file_path, content in context.diff_content.items():
-            for rule in rules:
-                violations = self._check_rule(file_path, content, rule)
-                issues.extend(violations)
+    def _check_file(self, file_path: str, content: str) -> List[Issue]:
+        """Check all in-scope architecture rules in a single pass over the file."""
+        patterns = self._union_patterns(file_path, content)
+        if not patterns:
+            return []
 
-        return issues
+        key = tuple(patterns)
+        combined = self._combined.get(key)
+        if combined is None:
+            combined = self._compile_union(patterns)
+            self._combined[key] = combined
 
-    def _check_rule(self, file_path: str, content: str, rule: dict) -> List[Issue]:
-        """Check a single architecture rule."""
+        hits = self._iter_union(combined, content)
+        return self._issues_from_matches(file_path, LineIndex(content), hits)
+
+    def _union_patterns(self, file_path: str, content: str) -> Dict[str, str]:
+        """Get the named patterns of the rules in scope for a file."""
+        return {
+            f"arch_{i}": f"(?m:{self._compiled[i].pattern})"
+            for i, rule in enumerate(self._rules)
+            if not getattr(rule, "scope", None)
+            or self._file_matches_scope(file_path, rule.scope)
+        }
+
+    def _issues_from_matches(
+        self,
+        file_path: str,
+        lines: LineIndex,
+        hits: Iterable[Tuple[str, re.Match]]
+    ) -> List[Issue]:
+        """Build issues from union hits on this analyzer's groups.
+
+        Rules apply to one line at a time. A hit spanning a line break, e.g.
+        through ``\\s``, is discarded and the rule is searched again within
+        each line it covered, which also finds hits on those lines that the
+        spanning one overlapped.
+        """
         issues = []
-        
-        if not self._file_matches_scope(file_path, rule["scope"]):
-            return issues
+        reported = set()
+
+        for group, match in hits:
+            index = int(group[len("arch_"):])
+            start, end = match.span(group)
+            first_line = lines.line_number(start)
+            last_line = lines.line_number(end)
+            if first_line == last_line:
+                line_numbers = [first_line]
+            else:
+                compiled = self._compiled[index]
+                line_numbers = [
+                    line_number
+                    for line_number in range(first_line, last_line + 1)
+                    if compiled.search(lines.content, *lines.span(line_number))
+                ]
 
-        pattern = re.compile(rule["pattern"])
-        for i, line in enumerate(content.splitlines(), 1):
-            if pattern.search(line):
+            rule = self._rules[index]
+            for line_number in line_numbers:
+                # Report each rule at most once per line
+                if (group, line_number) in reported:
+                    continue
+                reported.add((group, line_number))
                 issues.append(
                     self._create_issue(
                         severity=IssueSeverity.ERROR,
-                        message=rule["message"],
+                        message=rule.message,
                         file_path=file_path,
-                        line_number=i,
-                        code_snippet=line.strip(),
-                        rule_name=rule["name"]
+                        line_number=line_number,
+                        code_snippet=lines.line(line_number).strip(),
+                        rule_name=rule.name
                     )
                 )
 
@@ -45,4 +116,4 @@ class ArchitectureAnalyzer(BaseAnalyzer):
 
     def _file_matches_scope(self, file_path: str, scope_pattern: str) -> bool:
         """Check if file matches the rule scope."""
-        return bool(re.match(scope_pattern, file_path))
\ No newline at end of file
+        return _scope_match(scope_pattern, file_path)
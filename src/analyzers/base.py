@@ -1,21 +1,168 @@
 """Base analyzer implementation."""
+import asyncio
+import heapq
+import os
+import re
 from abc import ABC, abstractmethod
-from typing import List
+from array import array
+from bisect import bisect_left
+from concurrent.futures import Executor
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 
+from src.analyzers._re_cache import compile_re
 from src.core.models import Issue, PRContext
 
+_NEWLINE = re.compile("\n")
+
+# PRs with less content than this are scanned inline; below it, pickling
+# files to worker processes costs more than the parallel scan saves
+_INLINE_SCAN_SIZE = 256 * 1024
+
+def _balance_batches(files: List[Tuple[str, str]], count: int) -> List[List[Tuple[str, str]]]:
+    """Split files into at most `count` batches of roughly equal total size."""
+    batches: List[List[Tuple[str, str]]] = [[] for _ in range(min(count, len(files)))]
+    heap = [(0, i) for i in range(len(batches))]
+    for item in sorted(files, key=lambda item: len(item[1]), reverse=True):
+        size, i = heapq.heappop(heap)
+        batches[i].append(item)
+        heapq.heappush(heap, (size + len(item[1]), i))
+    return batches
+
+class UnionPattern(NamedTuple):
+    """Compiled forms of a set of named patterns fused by `_compile_union`."""
+
+    scan: re.Pattern
+    every: re.Pattern
+    groups: Tuple[str, ...]
+
+class LineIndex:
+    """Newline offsets of a file, built once for O(log n) line lookups."""
+
+    def __init__(self, content: str):
+        """Index the newline positions of the given content."""
+        self.content = content
+        self.newlines = array("q", [m.start() for m in _NEWLINE.finditer(content)])
+        # Number of lines, not counting the empty remainder after a final newline
+        self.line_count = len(self.newlines)
+        if content and not content.endswith("\n"):
+            self.line_count += 1
+
+    def line_number(self, pos: int) -> int:
+        """Get the 1-based line number for a position in the content."""
+        return bisect_left(self.newlines, pos) + 1
+
+    def span(self, line_number: int) -> Tuple[int, int]:
+        """Get the start and end offsets of a 1-based line, without its newline."""
+        start = self.newlines[line_number - 2] + 1 if line_number > 1 else 0
+        if line_number <= len(self.newlines):
+            return start, self.newlines[line_number - 1]
+        return start, len(self.content)
+
+    def line(self, line_number: int) -> str:
+        """Get the text of a 1-based line without its newline."""
+        start, end = self.span(line_number)
+        return self.content[start:end]
+
 class BaseAnalyzer(ABC):
     """Base class for all analyzers."""
 
-    def __init__(self, config):
-        """Initialize analyzer with configuration."""
+    def __init__(self, config, executor: Optional[Executor] = None):
+        """Initialize analyzer with configuration.
+
+        Args:
+            config: Agent configuration
+            executor: Optional process pool used to scan files in parallel
+        """
         self.config = config
+        self._executor = executor
+
+    def __getstate__(self):
+        """Drop the executor when the analyzer is shipped to a worker."""
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
 
     @abstractmethod
     async def analyze(self, context: PRContext) -> List[Issue]:
         """Analyze the PR and return found issues."""
         pass
 
+    @abstractmethod
+    def _check_file(self, file_path: str, content: str) -> List[Issue]:
+        """Check a single file and return found issues."""
+        pass
+
+    async def _scan_files(self, context: PRContext) -> List[Issue]:
+        """Run `_check_file` over every file in the PR.
+
+        Files are independent, so when an executor is configured and the PR
+        is large enough to repay the transfer, files are split into one
+        size-balanced batch per CPU and each batch is checked in a worker
+        process. Every file's content is pickled exactly once and the
+        analyzer once per batch rather than once per file. Small PRs are
+        checked inline without copying anything across processes.
+        """
+        files = list(context.diff_content.items())
+        total_size = sum(len(content) for _, content in files)
+        if self._executor is None or len(files) < 2 or total_size < _INLINE_SCAN_SIZE:
+            return self._check_files(files)
+
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(
+            loop.run_in_executor(self._executor, self._check_files, batch)
+            for batch in _balance_batches(files, os.cpu_count() or 1)
+        ))
+        return [issue for result in results for issue in result]
+
+    def _check_files(self, files: List[Tuple[str, str]]) -> List[Issue]:
+        """Check a batch of (file_path, content) pairs."""
+        issues = []
+        for file_path, content in files:
+            issues.extend(self._check_file(file_path, content))
+        return issues
+
     def _create_issue(self, **kwargs) -> Issue:
-        """Helper method to create an Issue instance."""
-        return Issue(**kwargs)
\ No newline at end of file
+        """Helper method to create an Issue instance.
+
+        Analyzer findings are built from our own match data, so validation
+        is skipped; issues from external sources still go through Issue().
+        """
+        return Issue.model_construct(**kwargs)
+
+    def _compile_union(self, patterns: Dict[str, str], flags: int = 0) -> UnionPattern:
+        """Combine named patterns for a single scan over a file.
+
+        Each pattern is wrapped in a named lookahead so that hits on
+        overlapping text are all reported. The `scan` alternation finds the
+        offsets where any pattern matches; since an alternation stops at its
+        first matching branch, the `every` sequence of optional lookaheads
+        is then matched at each such offset to collect every pattern that
+        starts there. Patterns are compiled with re.ASCII: all rule patterns
+        are ASCII, and ASCII-only classes and case folding keep the matcher
+        off the Unicode tables.
+        """
+        lookaheads = [f"(?=(?P<{name}>{pattern}))" for name, pattern in patterns.items()]
+        return UnionPattern(
+            scan=compile_re("|".join(lookaheads), flags | re.ASCII),
+            every=compile_re("".join(f"{lookahead}?" for lookahead in lookaheads), flags | re.ASCII),
+            groups=tuple(patterns)
+        )
+
+    def _iter_union(self, union: UnionPattern, content: str) -> Iterator[Tuple[str, re.Match]]:
+        """Scan content once with a pattern built by `_compile_union`.
+
+        Yields (group_name, match) for every hit, in group order for hits
+        starting at the same offset; the hit itself is
+        `match.group(group_name)`. Hits overlapping an earlier hit of the
+        same group are skipped, matching what `finditer` on the individual
+        pattern would have returned.
+        """
+        last_end: Dict[str, int] = {}
+        for found in union.scan.finditer(content):
+            match = union.every.match(content, found.start())
+            for group in union.groups:
+                start, end = match.span(group)
+                if start < 0 or start < last_end.get(group, 0):
+                    continue
+                last_end[group] = max(end, start + 1)
+                yield group, match
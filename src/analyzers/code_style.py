@@ -1,118 +1,199 @@
 """Code style analyzer implementation."""
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
+import ast
 import re
 
-from .base import BaseAnalyzer
+from ._re_cache import compile_re
+from .base import BaseAnalyzer, LineIndex
 from src.core.models import Issue, IssueSeverity, PRContext
 
 # Optional: Import LLM components if needed
 # from langchain.chat_models import AzureChatOpenAI
 # from langchain.prompts import PromptTemplate
 
+_NAMING_PATTERNS = {
+    "class": r"class\s+([a-z][a-zA-Z0-9]*)",
+    "method": r"(def|function)\s+([A-Z][a-zA-Z0-9]*)",
+    "variable": r"([A-Z][a-zA-Z0-9]*)\s*="
+}
+
+# Python naming conventions checked on the AST (PEP 8)
+_PY_CLASS_NAME = re.compile(r"_*[A-Z][A-Za-z0-9]*")
+_PY_FUNCTION_NAME = re.compile(r"[a-z_][a-z0-9_]*")
+_PY_VARIABLE_NAME = re.compile(r"[a-z_][a-z0-9_]*|[A-Z_][A-Z0-9_]*")
+
 class CodeStyleAnalyzer(BaseAnalyzer):
     """Analyzes code for style violations."""
 
+    def __init__(self, config, executor=None):
+        """Initialize analyzer and precompile the style check patterns."""
+        super().__init__(config, executor)
+        max_depth = self.config.rules.coding_standards.max_nesting_depth
+        # A line nests deeper than max_depth once it has (max_depth + 1) * 4
+        # leading whitespace characters (assuming 4 spaces per indent level)
+        self._deep_indent = compile_re(r"^[^\S\n]{%d}" % ((max_depth + 1) * 4), re.MULTILINE | re.ASCII)
+        # Simple method detection (can be improved based on language); matches
+        # from the start of the line so each signature line is found once
+        self._method_start = compile_re(
+            r"^[^\n]*?(?:def|function|public|private|protected)\s+\w+\s*\([^)]*\)",
+            re.MULTILINE | re.ASCII
+        )
+        self._naming_patterns = {
+            f"style_name_{conv_type}": pattern
+            for conv_type, pattern in _NAMING_PATTERNS.items()
+        }
+        self._naming = self._compile_union(self._naming_patterns)
+
     async def analyze(self, context: PRContext) -> List[Issue]:
         """Analyze PR for code style violations."""
+        return await self._scan_files(context)
+
+    def _check_file(self, file_path: str, content: str) -> List[Issue]:
+        """Run all style checks on a single file."""
         issues = []
-        rules = self.config.rules.coding_standards
+        lines = LineIndex(content)
 
-        for file_path, content in context.diff_content.items():
+        tree = self._parse_python(file_path, content)
+        if tree is not None:
+            # Check method length and naming conventions on the syntax tree
+            issues.extend(self._check_python(file_path, tree))
+        else:
             # Check method length
-            method_issues = self._check_method_length(file_path, content)
+            method_issues = self._check_method_length(file_path, content, lines)
             issues.extend(method_issues)
 
             # Check naming conventions
-            naming_issues = self._check_naming_conventions(file_path, content)
+            naming_issues = self._check_naming_conventions(file_path, content, lines)
             issues.extend(naming_issues)
 
-            # Check code complexity
-            complexity_issues = self._check_complexity(file_path, content)
-            issues.extend(complexity_issues)
+        # Check code complexity
+        complexity_issues = self._check_complexity(file_path, content, lines)
+        issues.extend(complexity_issues)
 
         return issues
 
-    def _check_method_length(self, file_path: str, content: str) -> List[Issue]:
-        """Check for methods that exceed maximum length."""
+    def _parse_python(self, file_path: str, content: str) -> Optional[ast.AST]:
+        """Parse a Python file, or return None for other files and invalid code.
+
+        Code too deeply nested for the parser also returns None, so it falls
+        back to the regex checks instead of failing the review.
+        """
+        if not file_path.endswith(".py"):
+            return None
+        try:
+            return ast.parse(content, filename=file_path)
+        except (SyntaxError, ValueError, RecursionError, MemoryError):
+            return None
+
+    def _check_python(self, file_path: str, tree: ast.AST) -> List[Issue]:
+        """Check method length and naming conventions of a parsed Python file.
+
+        Unlike the regex heuristics this sees decorated and nested
+        definitions and signatures spanning several lines.
+        """
         issues = []
         max_length = self.config.rules.coding_standards.max_method_length
-        
-        # Simple method detection (can be improved based on language)
-        method_pattern = r"(def|function|public|private|protected)\s+\w+\s*\([^)]*\)\s*\{?"
-        current_method = None
-        line_count = 0
-        
-        for i, line in enumerate(content.splitlines(), 1):
-            if re.search(method_pattern, line):
-                if current_method and line_count > max_length:
-                    issues.append(
-                        self._create_issue(
-                            severity=IssueSeverity.WARNING,
-                            message=f"Method exceeds maximum length of {max_length} lines",
-                            file_path=file_path,
-                            line_number=i - line_count,
-                            rule_name="max_method_length",
-                            suggested_fix="Consider breaking down the method into smaller functions"
-                        )
-                    )
-                current_method = line
-                line_count = 1
-            elif current_method:
-                line_count += 1
+
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if node.end_lineno - node.lineno + 1 > max_length:
+                    issues.append(self._method_length_issue(file_path, node.lineno, max_length))
+                if not _PY_FUNCTION_NAME.fullmatch(node.name):
+                    issues.append(self._naming_issue(file_path, "method", node.lineno))
+            elif isinstance(node, ast.ClassDef):
+                if not _PY_CLASS_NAME.fullmatch(node.name):
+                    issues.append(self._naming_issue(file_path, "class", node.lineno))
+            elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+                if not _PY_VARIABLE_NAME.fullmatch(node.id):
+                    issues.append(self._naming_issue(file_path, "variable", node.lineno))
 
         return issues
 
-    def _check_naming_conventions(self, file_path: str, content: str) -> List[Issue]:
+    def _check_method_length(self, file_path: str, content: str, lines: LineIndex) -> List[Issue]:
+        """Check for methods that exceed maximum length.
+
+        A method spans from its signature line up to the next method's
+        signature line, or to the end of the file for the last one.
+        """
+        issues = []
+        max_length = self.config.rules.coding_standards.max_method_length
+
+        start_lines = [
+            lines.line_number(match.start())
+            for match in self._method_start.finditer(content)
+        ]
+        end_lines = start_lines[1:] + [lines.line_count + 1]
+
+        for start_line, end_line in zip(start_lines, end_lines):
+            if end_line - start_line > max_length:
+                issues.append(self._method_length_issue(file_path, start_line, max_length))
+
+        return issues
+
+    def _method_length_issue(self, file_path: str, line_number: int, max_length: int) -> Issue:
+        """Create an issue for a method exceeding the maximum length."""
+        return self._create_issue(
+            severity=IssueSeverity.WARNING,
+            message=f"Method exceeds maximum length of {max_length} lines",
+            file_path=file_path,
+            line_number=line_number,
+            rule_name="max_method_length",
+            suggested_fix="Consider breaking down the method into smaller functions"
+        )
+
+    def _check_naming_conventions(self, file_path: str, content: str, lines: LineIndex) -> List[Issue]:
         """Check naming conventions."""
+        hits = self._iter_union(self._naming, content)
+        return self._issues_from_matches(file_path, lines, hits)
+
+    def _union_patterns(self, file_path: str, content: str) -> Dict[str, str]:
+        """Get the named naming-convention patterns that apply to a file."""
+        return self._naming_patterns
+
+    def _issues_from_matches(
+        self,
+        file_path: str,
+        lines: LineIndex,
+        hits: Iterable[Tuple[str, re.Match]]
+    ) -> List[Issue]:
+        """Build naming convention issues from union hits on this analyzer's groups."""
         issues = []
-        conventions = {
-            "class": r"class\s+([a-z][a-zA-Z0-9]*)",
-            "method": r"(def|function)\s+([A-Z][a-zA-Z0-9]*)",
-            "variable": r"([A-Z][a-zA-Z0-9]*)\s*="
-        }
 
-        for conv_type, pattern in conventions.items():
-            matches = re.finditer(pattern, content)
-            for match in matches:
-                issues.append(
-                    self._create_issue(
-                        severity=IssueSeverity.WARNING,
-                        message=f"Invalid {conv_type} name convention",
-                        file_path=file_path,
-                        line_number=self._get_line_number(content, match.start()),
-                        rule_name="naming_convention",
-                        suggested_fix=f"Follow {conv_type} naming convention"
-                    )
-                )
+        for group, match in hits:
+            conv_type = group[len("style_name_"):]
+            line_number = lines.line_number(match.start(group))
+            issues.append(self._naming_issue(file_path, conv_type, line_number))
 
         return issues
 
-    def _check_complexity(self, file_path: str, content: str) -> List[Issue]:
+    def _naming_issue(self, file_path: str, conv_type: str, line_number: int) -> Issue:
+        """Create an issue for a name violating a naming convention."""
+        return self._create_issue(
+            severity=IssueSeverity.WARNING,
+            message=f"Invalid {conv_type} name convention",
+            file_path=file_path,
+            line_number=line_number,
+            rule_name="naming_convention",
+            suggested_fix=f"Follow {conv_type} naming convention"
+        )
+
+    def _check_complexity(self, file_path: str, content: str, lines: LineIndex) -> List[Issue]:
         """Check code complexity metrics."""
         issues = []
         
-        # Check nesting depth
+        # Check nesting depth; only over-indented lines ever reach Python
         max_depth = self.config.rules.coding_standards.max_nesting_depth
-        current_depth = 0
         
-        for i, line in enumerate(content.splitlines(), 1):
-            indent_level = len(line) - len(line.lstrip())
-            depth = indent_level // 4  # Assuming 4 spaces per indent level
-            
-            if depth > max_depth:
-                issues.append(
-                    self._create_issue(
-                        severity=IssueSeverity.WARNING,
-                        message=f"Code nesting depth exceeds maximum of {max_depth}",
-                        file_path=file_path,
-                        line_number=i,
-                        rule_name="max_nesting_depth",
-                        suggested_fix="Consider restructuring to reduce nesting"
-                    )
+        for match in self._deep_indent.finditer(content):
+            issues.append(
+                self._create_issue(
+                    severity=IssueSeverity.WARNING,
+                    message=f"Code nesting depth exceeds maximum of {max_depth}",
+                    file_path=file_path,
+                    line_number=lines.line_number(match.start()),
+                    rule_name="max_nesting_depth",
+                    suggested_fix="Consider restructuring to reduce nesting"
                 )
+            )
 
-        return issues
-
-    def _get_line_number(self, content: str, pos: int) -> int:
-        """Get line number for a position in the content."""
-        return content[:pos].count('\n') + 1
\ No newline at end of file
+        return issues
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""Combined analyzer implementation."""
+from typing import Dict, List, Tuple
+
+from .architecture import ArchitectureAnalyzer
+from .base import BaseAnalyzer, LineIndex, UnionPattern
+from .code_style import CodeStyleAnalyzer
+from .security import SecurityAnalyzer
+from src.core.models import Issue, PRContext
+
+class CombinedAnalyzer(BaseAnalyzer):
+    """Runs architecture, style and security checks in one pass per file.
+
+    The regex checks of all analyzers are fused into a single master
+    pattern whose group names carry the owning analyzer's prefix (`arch_`,
+    `sec_`, `style_`), so each file is scanned once and every hit is routed
+    back to the analyzer that builds its issue. Line-based style checks
+    reuse the same line index.
+    """
+
+    def __init__(self, config, executor=None):
+        """Initialize the underlying analyzers."""
+        super().__init__(config, executor)
+        self._style = CodeStyleAnalyzer(config)
+        self._analyzers = {
+            "arch": ArchitectureAnalyzer(config),
+            "sec": SecurityAnalyzer(config),
+            "style": self._style,
+        }
+        # Master patterns keyed by the group names they combine
+        self._master: Dict[Tuple[str, ...], UnionPattern] = {}
+
+    async def analyze(self, context: PRContext) -> List[Issue]:
+        """Analyze PR for architecture, style and security issues."""
+        return await self._scan_files(context)
+
+    def _check_file(self, file_path: str, content: str) -> List[Issue]:
+        """Run every check on a single file with one regex sweep."""
+        issues = []
+        lines = LineIndex(content)
+
+        # Python files get their method and naming checks from the syntax tree
+        tree = self._style._parse_python(file_path, content)
+
+        patterns: Dict[str, str] = {}
+        for analyzer in self._analyzers.values():
+            if analyzer is self._style and tree is not None:
+                continue
+            patterns.update(analyzer._union_patterns(file_path, content))
+
+        key = tuple(patterns)
+        master = self._master.get(key)
+        if master is None:
+            master = self._compile_union(patterns)
+            self._master[key] = master
+
+        hits = {prefix: [] for prefix in self._analyzers}
+        for group, match in self._iter_union(master, content):
+            hits[group.split("_", 1)[0]].append((group, match))
+
+        for prefix, analyzer in self._analyzers.items():
+            issues.extend(analyzer._issues_from_matches(file_path, lines, hits[prefix]))
+
+        if tree is not None:
+            issues.extend(self._style._check_python(file_path, tree))
+        else:
+            issues.extend(self._style._check_method_length(file_path, content, lines))
+        issues.extend(self._style._check_complexity(file_path, content, lines))
+
+        return issues
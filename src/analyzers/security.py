@@ -1,125 +1,155 @@
 """Security analyzer implementation."""
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
 import re
 
-from .base import BaseAnalyzer
+from .base import BaseAnalyzer, LineIndex
 from src.core.models import Issue, IssueSeverity, PRContext
 
+# Each pattern is paired with a literal that every match contains. Files
+# without the literal skip the pattern via a cheap substring search; None
+# means the pattern has no such literal and always runs.
+_SQL_INJECTION_PATTERNS = [
+    (r"execute\s*\(\s*[\"'].*?\%.*?[\"']", "execute"),
+    (r"executemany\s*\(\s*[\"'].*?\%.*?[\"']", "executemany"),
+    (r"raw_connection\s*\(\s*[\"'].*?[\"']", "raw_connection"),
+    (r"cursor\.execute\s*\([^?]*\+", "cursor.execute"),
+]
+
+# Case-insensitive; literals are lowercase
+_SECRET_PATTERNS = {
+    "api_key": (r"api[_-]?key.*?['\"]([a-zA-Z0-9]{16,})['\"]", "api"),
+    "password": (r"password.*?['\"]([^'\"]{8,})['\"]", "password"),
+    "secret": (r"secret.*?['\"]([^'\"]{8,})['\"]", "secret"),
+    "token": (r"token.*?['\"]([a-zA-Z0-9_-]{8,})['\"]", "token"),
+}
+
+# Case-insensitive; literals are lowercase
+_INSECURE_CONFIG_PATTERNS = {
+    "debug_mode": (
+        r"debug\s*=\s*True",
+        "Debug mode enabled in configuration",
+        "Disable debug mode in production environments",
+        "debug"
+    ),
+    "cors_all": (
+        r"cors_allow_all\s*=\s*True|[\"']\\*[\"']",
+        "Overly permissive CORS configuration",
+        "Specify allowed origins explicitly",
+        None
+    ),
+    "ssl_verify": (
+        r"verify\s*=\s*False|SSL_VERIFY\s*=\s*False",
+        "SSL certificate verification disabled",
+        "Enable SSL certificate verification",
+        "verify"
+    ),
+}
+
 class SecurityAnalyzer(BaseAnalyzer):
     """Analyzes code for security vulnerabilities."""
 
+    def __init__(self, config, executor=None):
+        """Initialize analyzer and build the combined security pattern."""
+        super().__init__(config, executor)
+        patterns: Dict[str, str] = {}
+        # Group name -> (message, rule name, suggested fix, mask captured secret)
+        self._checks: Dict[str, Tuple[str, str, str, bool]] = {}
+        # Group name -> (required literal, match it case-insensitively)
+        self._literals: Dict[str, Tuple[Optional[str], bool]] = {}
+
+        for i, (pattern, literal) in enumerate(_SQL_INJECTION_PATTERNS):
+            patterns[f"sec_sql_{i}"] = pattern
+            self._literals[f"sec_sql_{i}"] = (literal, False)
+            self._checks[f"sec_sql_{i}"] = (
+                "Potential SQL injection vulnerability detected",
+                "sql_injection",
+                "Use parameterized queries or an ORM",
+                False
+            )
+
+        for secret_type, (pattern, literal) in _SECRET_PATTERNS.items():
+            patterns[f"sec_secret_{secret_type}"] = f"(?i:{pattern})"
+            self._literals[f"sec_secret_{secret_type}"] = (literal, True)
+            self._checks[f"sec_secret_{secret_type}"] = (
+                f"Hardcoded {secret_type} detected",
+                "hardcoded_secret",
+                "Use environment variables or a secure secret management system",
+                True
+            )
+
+        for check_name, (pattern, message, fix, literal) in _INSECURE_CONFIG_PATTERNS.items():
+            patterns[f"sec_config_{check_name}"] = f"(?i:{pattern})"
+            self._literals[f"sec_config_{check_name}"] = (literal, True)
+            self._checks[f"sec_config_{check_name}"] = (
+                message,
+                f"insecure_config_{check_name}",
+                fix,
+                False
+            )
+
+        self._patterns = patterns
+
     async def analyze(self, context: PRContext) -> List[Issue]:
         """Analyze PR for security vulnerabilities."""
+        return await self._scan_files(context)
+
+    def _check_file(self, file_path: str, content: str) -> List[Issue]:
+        """Check SQL injection, secret and config patterns in a single pass."""
+        patterns = self._union_patterns(file_path, content)
+        if not patterns:
+            return []
+
+        hits = self._iter_union(self._compile_union(patterns), content)
+        return self._issues_from_matches(file_path, LineIndex(content), hits)
+
+    def _union_patterns(self, file_path: str, content: str) -> Dict[str, str]:
+        """Get the named security patterns that can match in a file.
+
+        Patterns whose required literal does not occur in the content are
+        dropped, so files that cannot match never reach the regex engine.
+        """
+        lowered = None
+        patterns = {}
+        for group, pattern in self._patterns.items():
+            literal, ignore_case = self._literals[group]
+            if literal is not None:
+                if ignore_case:
+                    if lowered is None:
+                        lowered = content.lower()
+                    if literal not in lowered:
+                        continue
+                elif literal not in content:
+                    continue
+            patterns[group] = pattern
+        return patterns
+
+    def _issues_from_matches(
+        self,
+        file_path: str,
+        lines: LineIndex,
+        hits: Iterable[Tuple[str, re.Match]]
+    ) -> List[Issue]:
+        """Build issues from union hits on this analyzer's groups."""
         issues = []
-        rules = self.config.rules.security
-
-        for file_path, content in context.diff_content.items():
-            # Check for common security vulnerabilities
-            sql_injection_issues = self._check_sql_injection(file_path, content)
-            issues.extend(sql_injection_issues)
-
-            # Check for hardcoded secrets
-            secret_issues = self._check_hardcoded_secrets(file_path, content)
-            issues.extend(secret_issues)
-
-            # Check for insecure configurations
-            config_issues = self._check_insecure_configs(file_path, content)
-            issues.extend(config_issues)
 
-        return issues
-
-    def _check_sql_injection(self, file_path: str, content: str) -> List[Issue]:
-        """Check for potential SQL injection vulnerabilities."""
-        issues = []
-        patterns = [
-            r"execute\s*\(\s*[\"'].*?\%.*?[\"']",
-            r"executemany\s*\(\s*[\"'].*?\%.*?[\"']",
-            r"raw_connection\s*\(\s*[\"'].*?[\"']",
-            r"cursor\.execute\s*\([^?]*\+",
-        ]
-
-        for pattern in patterns:
-            matches = re.finditer(pattern, content)
-            for match in matches:
-                issues.append(
-                    self._create_issue(
-                        severity=IssueSeverity.ERROR,
-                        message="Potential SQL injection vulnerability detected",
-                        file_path=file_path,
-                        line_number=self._get_line_number(content, match.start()),
-                        code_snippet=match.group(),
-                        rule_name="sql_injection",
-                        suggested_fix="Use parameterized queries or an ORM"
-                    )
+        for group, match in hits:
+            message, rule_name, fix, mask_secret = self._checks[group]
+            snippet = match.group(group)
+            if mask_secret:
+                # The secret is the first capture group inside the named group
+                secret = match.group(match.re.groupindex[group] + 1)
+                snippet = snippet.replace(secret, "*" * len(secret))
+
+            issues.append(
+                self._create_issue(
+                    severity=IssueSeverity.ERROR,
+                    message=message,
+                    file_path=file_path,
+                    line_number=lines.line_number(match.start(group)),
+                    code_snippet=snippet,
+                    rule_name=rule_name,
+                    suggested_fix=fix
                 )
+            )
 
         return issues
-
-    def _check_hardcoded_secrets(self, file_path: str, content: str) -> List[Issue]:
-        """Check for hardcoded secrets and credentials."""
-        issues = []
-        patterns = {
-            "api_key": r"api[_-]?key.*?['\"]([a-zA-Z0-9]{16,})['\"]",
-            "password": r"password.*?['\"]([^'\"]{8,})['\"]",
-            "secret": r"secret.*?['\"]([^'\"]{8,})['\"]",
-            "token": r"token.*?['\"]([a-zA-Z0-9_-]{8,})['\"]",
-        }
-
-        for secret_type, pattern in patterns.items():
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                issues.append(
-                    self._create_issue(
-                        severity=IssueSeverity.ERROR,
-                        message=f"Hardcoded {secret_type} detected",
-                        file_path=file_path,
-                        line_number=self._get_line_number(content, match.start()),
-                        code_snippet=match.group().replace(match.group(1), "*" * len(match.group(1))),
-                        rule_name="hardcoded_secret",
-                        suggested_fix="Use environment variables or a secure secret management system"
-                    )
-                )
-
-        return issues
-
-    def _check_insecure_configs(self, file_path: str, content: str) -> List[Issue]:
-        """Check for insecure configuration settings."""
-        issues = []
-        patterns = {
-            "debug_mode": (
-                r"debug\s*=\s*True",
-                "Debug mode enabled in configuration",
-                "Disable debug mode in production environments"
-            ),
-            "cors_all": (
-                r"cors_allow_all\s*=\s*True|[\"']\\*[\"']",
-                "Overly permissive CORS configuration",
-                "Specify allowed origins explicitly"
-            ),
-            "ssl_verify": (
-                r"verify\s*=\s*False|SSL_VERIFY\s*=\s*False",
-                "SSL certificate verification disabled",
-                "Enable SSL certificate verification"
-            ),
-        }
-
-        for check_name, (pattern, message, fix) in patterns.items():
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                issues.append(
-                    self._create_issue(
-                        severity=IssueSeverity.ERROR,
-                        message=message,
-                        file_path=file_path,
-                        line_number=self._get_line_number(content, match.start()),
-                        code_snippet=match.group(),
-                        rule_name=f"insecure_config_{check_name}",
-                        suggested_fix=fix
-                    )
-                )
-
-        return issues
-
-    def _get_line_number(self, content: str, pos: int) -> int:
-        """Get line number for a position in the content."""
-        return content[:pos].count('\n') + 1
\ No newline at end of file
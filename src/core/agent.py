@@ -1,7 +1,11 @@
 """Core agent implementation using LangChain and MCP."""
-from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 import asyncio
 import logging
+import multiprocessing
+import random
 import sys
 from pathlib import Path
 
@@ -19,14 +23,53 @@ from pydantic import BaseModel
 
 from src.analyzers.architecture import ArchitectureAnalyzer
 from src.analyzers.code_style import CodeStyleAnalyzer
+from src.analyzers.combined import CombinedAnalyzer
 from src.analyzers.security import SecurityAnalyzer
 from src.core.config import AgentConfig
-from src.core.models import PRContext, ReviewResult
+from src.core.models import AgentStats, PRContext, ReviewResult
 from src.utils.mcp import MCPClient
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+def _worker_context() -> multiprocessing.context.BaseContext:
+    """Get the start method for analyzer workers: forkserver where available, else spawn."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+# pull_request actions that change what there is to review; others, such as
+# closed, labeled or edited, and pull_request_review events (including the
+# agent's own posted reviews) must not trigger another review
+_REVIEW_ACTIONS = frozenset({"opened", "synchronize", "reopened", "ready_for_review"})
+
+@lru_cache(maxsize=4)
+def _build_llm(deployment_name: str, endpoint: str, api_key: str, api_version: str) -> AzureChatOpenAI:
+    """Build the Azure OpenAI chat client, shared by agents with the same settings."""
+    return AzureChatOpenAI(
+        deployment_name=deployment_name,
+        temperature=0.1,
+        azure_endpoint=endpoint,
+        api_key=api_key,
+        openai_api_version=api_version,
+        max_tokens=2000
+    )
+
+@lru_cache(maxsize=1)
+def _build_prompt() -> ChatPromptTemplate:
+    """Build the agent prompt, which does not depend on configuration."""
+    system_message = SystemMessage(
+        content="""You are a code review assistant that helps analyze pull requests.
+        Your goal is to identify issues and suggest improvements in the code.
+        Be thorough but constructive in your feedback."""
+    )
+    
+    return ChatPromptTemplate.from_messages([
+        system_message,
+        MessagesPlaceholder(variable_name="chat_history"),
+        MessagesPlaceholder(variable_name="agent_scratchpad"),
+    ])
+
 class PRReviewerAgent:
     """Main agent class for PR review automation."""
 
@@ -47,14 +90,22 @@ class PRReviewerAgent:
             github_api_url=config.integrations.github.api_url if config.integrations and config.integrations.github else "https://api.github.com"
         )
         
+        # Bound concurrent reviews to avoid GitHub/MCP rate-limit storms
+        self._review_slots = asyncio.Semaphore(config.concurrent_reviews)
+        
         # Initialize statistics
-        self.stats = {"prs_reviewed": 0, "issues_found": 0}
+        self.stats = AgentStats()
 
     def _setup_analyzers(self):
         """Initialize code analyzers."""
-        self.architecture_analyzer = ArchitectureAnalyzer(self.config)
-        self.style_analyzer = CodeStyleAnalyzer(self.config)
-        self.security_analyzer = SecurityAnalyzer(self.config)
+        # Shared worker pool so analyzers scan files on multiple cores. Workers
+        # start from a clean server process rather than forking this one,
+        # whose other threads may hold locks the child would inherit
+        self.analyzer_pool = ProcessPoolExecutor(mp_context=_worker_context())
+        self.architecture_analyzer = ArchitectureAnalyzer(self.config, self.analyzer_pool)
+        self.style_analyzer = CodeStyleAnalyzer(self.config, self.analyzer_pool)
+        self.security_analyzer = SecurityAnalyzer(self.config, self.analyzer_pool)
+        self.combined_analyzer = CombinedAnalyzer(self.config, self.analyzer_pool)
 
     def _setup_tools(self) -> List[BaseTool]:
         """Set up LangChain tools for the agent."""
@@ -78,40 +129,19 @@ class PRReviewerAgent:
 
     def _setup_executor(self) -> AgentExecutor:
         """Set up the LangChain agent executor."""
-        from langchain.chat_models import AzureChatOpenAI
-        from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
-        from langchain.schema import SystemMessage
-        from langchain.agents import OpenAIFunctionsAgent
-        
-        # Initialize Azure OpenAI chat model
-        llm = AzureChatOpenAI(
-            deployment_name=self.config.azure_openai_chat_deployment_name,
-            temperature=0.1,
-            azure_endpoint=self.config.azure_openai_endpoint,
-            api_key=self.config.azure_openai_api_key,            
-            openai_api_version=self.config.azure_openai_api_version,
-            max_tokens=2000           
+        # Reuse the chat client and prompt; only the tools are per agent
+        llm = _build_llm(
+            self.config.azure_openai_chat_deployment_name,
+            self.config.azure_openai_endpoint,
+            self.config.azure_openai_api_key,
+            self.config.azure_openai_api_version
         )
         
-        # Create the agent prompt
-        system_message = SystemMessage(
-            content="""You are a code review assistant that helps analyze pull requests.
-            Your goal is to identify issues and suggest improvements in the code.
-            Be thorough but constructive in your feedback."""
-        )
-        
-        prompt = ChatPromptTemplate.from_messages([
-            system_message,
-            MessagesPlaceholder(variable_name="chat_history"),
-            MessagesPlaceholder(variable_name="agent_scratchpad"),
-        ])
-        
         # Initialize the agent using the recommended create_openai_functions_agent method
-        from langchain.agents import create_openai_functions_agent
         agent = create_openai_functions_agent(
             llm=llm,
             tools=self.tools,
-            prompt=prompt
+            prompt=_build_prompt()
         )
         
         # Create and return the agent executor
@@ -133,9 +163,16 @@ class PRReviewerAgent:
     async def stop(self):
         """Stop the agent."""
         self.running = False
+        self.analyzer_pool.shutdown(wait=False, cancel_futures=True)
+        await self.mcp_client.close()
 
     async def _monitor_prs(self):
-        """Monitor for new PRs using MCP."""
+        """Monitor for new PRs using MCP.
+
+        Failed polling cycles are retried with capped exponential backoff and
+        full jitter; the backoff resets after a successful cycle.
+        """
+        backoff = self.config.error_retry_interval
         while self.running:
             try:
                 # Get PR updates through MCP
@@ -145,33 +182,65 @@ class PRReviewerAgent:
                     repositories=repositories
                 )
                 
-                # Process each PR
-                for pr in prs:
-                    try:
-                        # Get PR context through MCP
-                        pr_context = await self.mcp_client.get_pr_context(pr)
-                        
-                        # Review the PR
-                        review_result = await self.review_pr(pr_context)
-                        
-                        # Post review comments through MCP
-                        await self.mcp_client.post_review(
-                            pr_context.repository,
-                            pr_context.pr_number,
-                            review_result
-                        )
-                        
-                        logger.info(f"Completed review for PR #{pr_context.pr_number}")
-                    
-                    except Exception as e:
-                        logger.error(f"Error reviewing PR: {e}")
+                # Process PRs concurrently, each one fetched, reviewed and
+                # posted as soon as its own previous step completes
+                await asyncio.gather(*(self._process_pr(pr) for pr in prs))
                 
                 # Wait for next polling interval
+                backoff = self.config.error_retry_interval
                 await asyncio.sleep(self.config.polling_interval)
             
             except Exception as e:
                 logger.error(f"Error in PR monitoring: {e}")
-                await asyncio.sleep(self.config.error_retry_interval)
+                await asyncio.sleep(random.uniform(0, backoff))
+                backoff = min(backoff * 2, self.config.max_error_backoff)
+
+    async def handle_github_events_batch(self, events: List[Tuple[str, Dict]]) -> None:
+        """Review the pull requests referenced by a batch of webhook events.
+        
+        Args:
+            events: (event type, payload) pairs in arrival order. Several
+                events for the same PR result in a single review. Only
+                pull_request events with an action in _REVIEW_ACTIONS are
+                reviewed.
+        """
+        prs = {}
+        for event_type, event_data in events:
+            action = event_data.get("action")
+            if event_type != "pull_request" or action not in _REVIEW_ACTIONS:
+                logger.debug("Ignoring %s event with action %s", event_type, action)
+                continue
+            pull_request = event_data.get("pull_request")
+            repository = event_data.get("repository")
+            if not pull_request or not repository:
+                logger.debug("Ignoring %s event without a pull request", event_type)
+                continue
+            key = (repository["full_name"], pull_request["number"])
+            prs[key] = {"repository": key[0], "number": key[1]}
+        
+        await asyncio.gather(*(self._process_pr(pr) for pr in prs.values()))
+
+    async def _process_pr(self, pr: Dict) -> None:
+        """Fetch, review and post the review for a single PR."""
+        async with self._review_slots:
+            try:
+                # Get PR context through MCP
+                pr_context = await self.mcp_client.get_pr_context(pr)
+                
+                # Review the PR
+                review_result = await self.review_pr(pr_context)
+                
+                # Post review comments through MCP
+                await self.mcp_client.post_review(
+                    pr_context.repository,
+                    pr_context.pr_number,
+                    review_result
+                )
+                
+                logger.info(f"Completed review for PR #{pr_context.pr_number}")
+            
+            except Exception as e:
+                logger.error(f"Error reviewing PR: {e}")
 
     async def review_pr(self, pr_context: PRContext) -> ReviewResult:
         """Review a pull request."""
@@ -179,23 +248,18 @@ class PRReviewerAgent:
             # Get MCP analysis first
             mcp_issues = await self.mcp_client.analyze_pull_request(pr_context)
             
-            # Run local analyzers in parallel
-            local_results = await asyncio.gather(
-                self.architecture_analyzer.analyze(pr_context),
-                self.style_analyzer.analyze(pr_context),
-                self.security_analyzer.analyze(pr_context)
-            )
+            # Run all local checks in a single pass over each file
+            local_issues = await self.combined_analyzer.analyze(pr_context)
             
             # Combine MCP and local results
-            all_issues = mcp_issues + [
-                issue
-                for result in local_results
-                for issue in result
-            ]
+            all_issues = mcp_issues + local_issues
             
             # Generate summary using LLM
             summary = await self._generate_summary(all_issues)
             
+            self.stats.prs_reviewed += 1
+            self.stats.issues_found += len(all_issues)
+            
             return ReviewResult(
                 issues=all_issues,
                 summary=summary,
@@ -1,77 +1,154 @@
 """Configuration management for the PR Reviewer Agent."""
+import copy
+import fnmatch
 import logging
 import os
+import re
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, FrozenSet, List, Optional, Tuple
 
-import yaml
-from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
-from pydantic import BaseModel, field_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, TypeAdapter, field_validator
 
 # Setup logger
 logger = logging.getLogger(__name__)
 
-# Load environment variables from .env file
-load_dotenv()
+# Sentinel for keys absent from a merge target
+_MISSING = object()
 
-class InsecureConfig(BaseModel):
+# Default settings file locations, searched in order
+_CONFIG_SEARCH_PATHS = [
+    str(Path(__file__).parent.parent.parent / "config" / "settings.yaml"),  # Root config dir
+    str(Path(__file__).parent.parent / "config" / "settings.yaml"),         # src/config
+    str(Path(__file__).parent / "config" / "settings.yaml"),               # core/config
+    str(Path("config") / "settings.yaml"),                                 # ./config
+]
+
+# Settings file found by the last search, reused by later loads
+_resolved_config_path: Optional[str] = None
+
+# Whether .env has been loaded into the environment
+_dotenv_loaded = False
+
+# Parsed config files by path, with the (mtime, size) stamp they were read at
+_YAML_CACHE: Dict[str, Tuple[int, int, Dict]] = {}
+
+def _validate_pattern(value: str) -> str:
+    """Compile a rule pattern so a bad regex fails at load time, not mid-review."""
+    try:
+        re.compile(value)
+    except re.error as e:
+        raise ValueError(f"Invalid regex pattern {value!r}: {e}") from e
+    return value
+
+# A regex rule pattern, checked once when the configuration is loaded
+RegexPattern = Annotated[str, AfterValidator(_validate_pattern)]
+
+# Shell-style wildcards, and syntax that only appears in regex scopes
+_GLOB_SCOPE = re.compile(r"[*?\[]")
+_REGEX_SCOPE = re.compile(r"[\\^$+(){}|]|\.[*+?]")
+
+def scope_regex(scope: str) -> str:
+    """Get the regex source for a rule scope.
+
+    Scopes with wildcards, such as ``*/controller/*`` or ``*.*``, are globs
+    matched against the whole path, unless they use regex-only syntax and
+    compile as a regex. Anything else is a regex matched from the start of
+    the path, so plain prefixes such as ``src/api/`` match everything below.
+
+    Args:
+        scope: Scope as written in the configuration
+
+    Returns:
+        Regex source to match file paths with re.match
+    """
+    if _GLOB_SCOPE.search(scope) and not _is_regex_scope(scope):
+        return fnmatch.translate(scope)
+    return scope
+
+def _is_regex_scope(scope: str) -> bool:
+    """Check whether a wildcard scope is meant as a regex rather than a glob."""
+    if not _REGEX_SCOPE.search(scope):
+        return False
+    try:
+        re.compile(scope)
+    except re.error:
+        return False
+    return True
+
+def _validate_scope(value: str) -> str:
+    """Compile a rule scope so a bad one fails at load time, not mid-review."""
+    try:
+        re.compile(scope_regex(value))
+    except re.error as e:
+        raise ValueError(f"Invalid scope {value!r}: {e}") from e
+    return value
+
+# A rule scope, as a glob or a regex prefix, checked when the configuration is loaded
+ScopePattern = Annotated[str, AfterValidator(_validate_scope)]
+
+class ConfigModel(BaseModel):
+    """Base for configuration sections, which are read-only once loaded."""
+    model_config = ConfigDict(frozen=True)
+
+class InsecureConfig(ConfigModel):
     """Insecure configuration pattern and message."""
-    pattern: str
+    pattern: RegexPattern
     message: str
 
-class SecurityRules(BaseModel):
+class SecurityRules(ConfigModel):
     """Security rule configurations."""
-    sql_injection_patterns: List[str]
-    secret_patterns: Dict[str, str]
+    sql_injection_patterns: List[RegexPattern]
+    secret_patterns: Dict[str, RegexPattern]
     insecure_configs: Dict[str, InsecureConfig]
 
-class LayerViolation(BaseModel):
+class LayerViolation(ConfigModel):
     """Layer violation rule."""
     name: str
-    pattern: str
-    scope: str
+    pattern: RegexPattern
+    scope: ScopePattern
     message: str
 
-class DependencyRule(BaseModel):
+class DependencyRule(ConfigModel):
     """Dependency rule."""
     name: str
-    pattern: str
+    pattern: RegexPattern
     message: str
-    scope: Optional[str] = None
+    scope: Optional[ScopePattern] = None
 
-class PatternViolation(BaseModel):
+class PatternViolation(ConfigModel):
     """Pattern violation rule."""
     name: str
-    pattern: str
+    pattern: RegexPattern
     message: str
 
-class ArchitectureRules(BaseModel):
+class ArchitectureRules(ConfigModel):
     """Architecture rule configurations."""
     layer_violations: List[LayerViolation]
     dependency_rules: List[DependencyRule]
     pattern_violations: List[PatternViolation]
 
-class ComplexityRules(BaseModel):
+class ComplexityRules(ConfigModel):
     """Code complexity rules."""
     max_cognitive_complexity: int
     max_cyclomatic_complexity: int
     max_parameters: int
 
-class CodingStandardRules(BaseModel):
+class CodingStandardRules(ConfigModel):
     """Coding standard rule configurations."""
     max_method_length: int
     max_nesting_depth: int
-    naming_conventions: Dict[str, str]
+    naming_conventions: Dict[str, RegexPattern]
     complexity_rules: ComplexityRules
 
-class Rules(BaseModel):
+class Rules(ConfigModel):
     """All rule configurations."""
     security: SecurityRules
     architecture: ArchitectureRules
     coding_standards: CodingStandardRules
 
-class LoggingConfig(BaseModel):
+class LoggingConfig(ConfigModel):
     """Logging configuration."""
     level: str
     file: str
@@ -79,51 +156,51 @@ class LoggingConfig(BaseModel):
     max_size: str
     backup_count: int
 
-class MCPConfig(BaseModel):
+class MCPConfig(ConfigModel):
     """MCP integration configuration."""
     endpoint: str = "https://mcp.github.dev/v1"  # Default to GitHub-hosted MCP
     batch_size: int
     timeout: int
     retry: Dict[str, int]
 
-class AzureOpenAIConfig(BaseModel):
+class AzureOpenAIConfig(ConfigModel):
     """Azure OpenAI configuration."""
     deployment: str
     temperature: float
     max_tokens: int
     timeout: int
 
-class GithubConfig(BaseModel):
+class GithubConfig(ConfigModel):
     """GitHub integration configuration."""
     webhook_events: List[str] = ["pull_request", "pull_request_review"]
     required_status_checks: List[str] = ["pr-review", "security-scan"]
     webhook_secret: Optional[str] = None
     api_url: str = "https://api.github.com"  # Default GitHub API URL
 
-class IntegrationsConfig(BaseModel):
+class IntegrationsConfig(ConfigModel):
     """All integrations configuration."""
     github: GithubConfig
     azure_openai: AzureOpenAIConfig
 
-class AnalysisConfig(BaseModel):
+class AnalysisConfig(ConfigModel):
     """Analysis configuration."""
     severity_levels: Dict[str, str]
     prioritization: Dict[str, int]
     ignore_patterns: List[str]
 
-class CacheConfig(BaseModel):
+class CacheConfig(ConfigModel):
     """Cache configuration."""
     enabled: bool
     ttl: int
     max_size: int
 
-class RateLimitingConfig(BaseModel):
+class RateLimitingConfig(ConfigModel):
     """Rate limiting configuration."""
     enabled: bool
     max_requests: int
     window_seconds: int
 
-class PerformanceConfig(BaseModel):
+class PerformanceConfig(ConfigModel):
     """Performance configuration."""
     cache: CacheConfig
     rate_limiting: RateLimitingConfig
@@ -140,6 +217,7 @@ class AgentConfig(BaseSettings):
     concurrent_reviews: int = 5
     polling_interval: int = 60
     error_retry_interval: int = 300
+    max_error_backoff: int = 3600
     
     # Azure OpenAI Configuration
     azure_openai_api_key: Optional[str] = None
@@ -174,6 +252,7 @@ class AgentConfig(BaseSettings):
         'use_enum_values': True,
         'str_strip_whitespace': True,
         'env_prefix': '',  # Allow environment variables without prefix
+        'frozen': True,
     }
 
     @property
@@ -183,6 +262,11 @@ class AgentConfig(BaseSettings):
             return []
         return [r.strip() for r in self.monitored_repositories.split(",") if r.strip()]
 
+    @cached_property
+    def repository_set(self) -> FrozenSet[str]:
+        """Get the monitored repositories as a set for membership checks."""
+        return frozenset(self.repository_list)
+
     @field_validator("monitored_repositories", mode="before")
     @classmethod
     def validate_repositories(cls, v: Any) -> str:
@@ -193,24 +277,112 @@ class AgentConfig(BaseSettings):
             return ",".join(str(x).strip() for x in v if str(x).strip())
         return str(v).strip()
 
+# Validators for AgentConfig's nested sections, built once
+_COMPONENT_ADAPTERS = {
+    name: TypeAdapter(AgentConfig.model_fields[name].annotation)
+    for name in ("rules", "logging", "mcp", "analysis", "performance", "integrations")
+}
+
+# Validated sections for the most recently loaded settings file version
+_COMPONENT_CACHE: Dict[Optional[Tuple[str, int, int]], Dict[str, Any]] = {}
+
 def deep_merge(target: Dict, source: Dict) -> Dict:
     """Deep merge two dictionaries."""
-    for key, value in source.items():
-        if key in target:
-            if isinstance(target[key], dict) and isinstance(value, dict):
-                deep_merge(target[key], value)
+    stack = [(target, source)]
+    while stack:
+        tgt, src = stack.pop()
+        for key, value in src.items():
+            current = tgt.get(key, _MISSING)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
             else:
-                target[key] = value
-        else:
-            target[key] = value
+                tgt[key] = value
     return target
 
+def _find_config_file() -> Optional[str]:
+    """Find the settings file in the default locations.
+    
+    Returns:
+        Optional[str]: Path of the first existing file, or None if there is none.
+    """
+    global _resolved_config_path
+    if _resolved_config_path is None:
+        _resolved_config_path = next(
+            (path for path in _CONFIG_SEARCH_PATHS if os.path.isfile(path)),
+            None
+        )
+    return _resolved_config_path
+
+def _load_dotenv_once() -> None:
+    """Load the .env file into the environment on the first call only."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _dotenv_loaded = True
+
+@lru_cache(maxsize=1)
+def _yaml_loader() -> type:
+    """Get the fastest safe YAML loader, preferring the libyaml C loader."""
+    try:
+        from yaml import CSafeLoader
+        return CSafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+        return SafeLoader
+
+def _read_yaml(config_path: str) -> Tuple[Tuple[str, int, int], Dict]:
+    """Parse a YAML file, reusing the previous parse while the file is unchanged.
+    
+    Args:
+        config_path: Path to the YAML file.
+    
+    Returns:
+        Tuple: The (path, mtime, size) version of the file that was read, and a
+            fresh copy of the parsed document, safe for the caller to mutate.
+    """
+    import yaml
+
+    path = os.path.abspath(config_path)
+    st = os.stat(path)
+    cached = _YAML_CACHE.get(path)
+    if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+        # One read of the raw bytes; libyaml decodes and scans them itself
+        with open(path, "rb") as f:
+            data = yaml.load(f.read(), Loader=_yaml_loader()) or {}
+        cached = (st.st_mtime_ns, st.st_size, data)
+        _YAML_CACHE[path] = cached
+    return (path, *cached[:2]), copy.deepcopy(cached[2])
+
+def _validate_components(source: Optional[Tuple[str, int, int]], config: Dict) -> Dict[str, Any]:
+    """Validate the nested configuration sections once per settings file version.
+    
+    The sections come only from the defaults and the settings file, so the
+    validated models are reused until the file changes.
+    
+    Args:
+        source: Version of the settings file merged into config, or None.
+        config: Merged configuration dictionary.
+    
+    Returns:
+        Dict[str, Any]: Validated section models by field name.
+    """
+    cached = _COMPONENT_CACHE.get(source)
+    if cached is None:
+        cached = {
+            name: adapter.validate_python(config.get(name))
+            for name, adapter in _COMPONENT_ADAPTERS.items()
+        }
+        _COMPONENT_CACHE.clear()
+        _COMPONENT_CACHE[source] = cached
+    return cached
+
 def load_config(config_path: Optional[str] = None) -> AgentConfig:
     """Load configuration from file and environment variables.
     
     Args:
         config_path: Optional path to the configuration file. If not provided,
-                    will look in default locations.
+                    AGENT_CONFIG_PATH is used, then the default locations.
     
     Returns:
         AgentConfig: Configuration instance with loaded settings.
@@ -219,31 +391,24 @@ def load_config(config_path: Optional[str] = None) -> AgentConfig:
         FileNotFoundError: If configuration file cannot be found.
         yaml.YAMLError: If configuration file is invalid YAML.
     """
+    # PyYAML and dotenv are only needed here, so importing the models stays cheap
+    import yaml
+
     # Load environment variables
-    load_dotenv()
+    _load_dotenv_once()
 
     # Start with default configuration
     config = get_default_config()
     
     # Find config file if not provided
     if not config_path:
-        possible_paths = [
-            Path(__file__).parent.parent.parent / "config" / "settings.yaml",  # Root config dir
-            Path(__file__).parent.parent / "config" / "settings.yaml",         # src/config
-            Path(__file__).parent / "config" / "settings.yaml",               # core/config
-            Path("config") / "settings.yaml",                                 # ./config
-        ]
-        
-        for path in possible_paths:
-            if path.exists():
-                config_path = str(path)
-                break
+        config_path = os.environ.get("AGENT_CONFIG_PATH") or _find_config_file()
     
     # Load YAML configuration if available
+    source = None
     if config_path:
         try:
-            with open(config_path) as f:
-                yaml_config = yaml.safe_load(f)
+            source, yaml_config = _read_yaml(config_path)
             config = deep_merge(config, yaml_config)
         except FileNotFoundError:
             logger.warning(f"Configuration file not found at {config_path}, using defaults")
@@ -252,6 +417,7 @@ def load_config(config_path: Optional[str] = None) -> AgentConfig:
             raise
     
     try:
+        config.update(_validate_components(source, config))
         # Let Pydantic handle the environment variables and validation
         return AgentConfig(**config)
     except Exception as e:
@@ -259,7 +425,15 @@ def load_config(config_path: Optional[str] = None) -> AgentConfig:
         raise
 
 def get_default_config() -> Dict:
-    """Get default configurations."""
+    """Get default configurations.
+    
+    Returns:
+        Dict: A fresh copy of the defaults, safe for the caller to merge into.
+    """
+    return copy.deepcopy(_DEFAULT_CONFIG)
+
+def _build_default_config() -> Dict:
+    """Build the default configuration tree."""
     return {
         "environment": "development",
         "review_timeout": 300,
@@ -267,6 +441,7 @@ def get_default_config() -> Dict:
         "concurrent_reviews": 5,
         "polling_interval": 60,
         "error_retry_interval": 300,
+        "max_error_backoff": 3600,
         
         "rules": {
             "security": {
@@ -420,4 +595,7 @@ def get_default_config() -> Dict:
                 "timeout": 30
             }
         }
-    }
\ No newline at end of file
+    }
+
+# Built once at import; get_default_config hands out copies
+_DEFAULT_CONFIG = _build_default_config()
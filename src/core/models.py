@@ -15,10 +15,10 @@ class Issue(BaseModel):
     severity: IssueSeverity
     message: str
     file_path: str
-    line_number: Optional[int]
-    code_snippet: Optional[str]
+    line_number: Optional[int] = None
+    code_snippet: Optional[str] = None
     rule_name: str
-    suggested_fix: Optional[str]
+    suggested_fix: Optional[str] = None
 
 class PRContext(BaseModel):
     """Context information about a pull request."""
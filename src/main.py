@@ -2,16 +2,19 @@
 import asyncio
 import hashlib
 import hmac
-import json
 import logging
+import re
 import sys
 from pathlib import Path
+from typing import Dict, List, Set, Tuple
 
 # Add the project root directory to Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
+import orjson
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import Response
 from pydantic_settings import BaseSettings
 
 from src.core.agent import PRReviewerAgent
@@ -31,77 +34,188 @@ logger = logging.getLogger(__name__)
 # Initialize the agent
 agent = PRReviewerAgent(config)
 
+# GitHub caps webhook payloads at 25 MB
+MAX_WEBHOOK_PAYLOAD = 25 * 1024 * 1024
+
+# Pending webhook events, and how many are handed to the agent at once
+WEBHOOK_QUEUE_SIZE = 1000
+WEBHOOK_BATCH_SIZE = 50
+# How long to wait for more events to join a batch, in seconds
+WEBHOOK_BATCH_WINDOW = 0.05
+
+# Pre-serialized replies, so hot paths skip response encoding
+_IGNORED_BODY = b'{"status":"ignored"}'
+_PROCESSING_BODY = b'{"status":"processing"}'
+_HEALTHY_BODY = b'{"status":"healthy"}'
+
+# The repository's own full_name, which GitHub sends before its nested objects
+_REPO_FULL_NAME = re.compile(rb'"repository"\s*:\s*\{[^{}]*?"full_name"\s*:\s*"([^"\\]*)"')
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize the agent on startup."""
     logger.info("Starting PR Reviewer Agent")
+    
+    # Key the webhook HMAC once; each request hashes with a copy of it
+    github = config.integrations.github if config.integrations else None
+    if github and github.webhook_secret:
+        app.state.hmac_template = hmac.new(
+            github.webhook_secret.encode(),
+            digestmod=hashlib.sha256
+        )
+    else:
+        app.state.hmac_template = None
+    
+    # Resolve the per-request filters once instead of walking the config
+    app.state.webhook_events = frozenset(
+        github.webhook_events if github else ("pull_request", "pull_request_review")
+    )
+    app.state.repositories = config.repository_set
+    
+    # Webhooks only enqueue events; a background task hands them to the
+    # agent in batches, each reviewed in its own task
+    app.state.event_queue = asyncio.Queue(maxsize=WEBHOOK_QUEUE_SIZE)
+    app.state.review_tasks = set()
+    app.state.event_drainer = asyncio.create_task(
+        _drain_events(app.state.event_queue, app.state.review_tasks)
+    )
+    
     await agent.start()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
     logger.info("Shutting down PR Reviewer Agent")
+    app.state.event_drainer.cancel()
+    for task in app.state.review_tasks:
+        task.cancel()
+    await asyncio.gather(
+        app.state.event_drainer,
+        *app.state.review_tasks,
+        return_exceptions=True
+    )
     await agent.stop()
 
+async def _drain_events(queue: asyncio.Queue, tasks: Set[asyncio.Task]) -> None:
+    """Hand queued webhook events to the agent in batches.
+    
+    Batches are reviewed in background tasks, so a slow review never holds
+    up the queue; the agent's review slots bound how many run at once.
+    
+    Args:
+        queue: Queue of (event type, payload) pairs filled by the webhook.
+        tasks: Set holding the running batch tasks until they finish.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        
+        # Let a burst of events for the same PRs collect into one batch
+        deadline = loop.time() + WEBHOOK_BATCH_WINDOW
+        while len(batch) < WEBHOOK_BATCH_SIZE:
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), deadline - loop.time()))
+            except asyncio.TimeoutError:
+                break
+        
+        task = asyncio.create_task(_handle_batch(batch))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+async def _handle_batch(batch: List[Tuple[str, Dict]]) -> None:
+    """Review a batch of webhook events, logging rather than raising errors."""
+    try:
+        await agent.handle_github_events_batch(batch)
+    except Exception as e:
+        logger.error("Error handling webhook events: %s", e)
+
 @app.get("/status")
 async def get_status():
     """Get agent status."""
-    return await agent.get_status()
+    return Response(orjson.dumps(await agent.get_status()), media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return Response(_HEALTHY_BODY, media_type="application/json")
 
 @app.post("/webhook")
 async def github_webhook(request: Request):
     """Handle GitHub webhook events."""
-    body = await request.body()
+    event_type = request.headers.get("X-GitHub-Event")
     
-    # Verify webhook signature if secret is configured
-    if (config.integrations and config.integrations.github and 
-        config.integrations.github.webhook_secret):
+    # Check if this is an event type we're monitoring; ignored events are
+    # never acted on, so they are dropped before reading or verifying the body
+    if event_type not in app.state.webhook_events:
+        logger.info("Ignoring unhandled event type: %s", event_type)
+        return Response(_IGNORED_BODY, media_type="application/json")
+    
+    mac = None
+    if app.state.hmac_template is not None:
         signature = request.headers.get("X-Hub-Signature-256")
         if not signature:
             raise HTTPException(status_code=400, detail="No signature provided")
         
-        # Verify webhook secret
-        secret = config.integrations.github.webhook_secret.encode()
-        expected_signature = "sha256=" + hmac.new(
-            secret,
-            msg=body,
-            digestmod=hashlib.sha256
-        ).hexdigest()
-        
-        if not hmac.compare_digest(signature, expected_signature):
+        # Compare raw digests rather than hex strings
+        algorithm, _, signature_hex = signature.partition("=")
+        try:
+            provided_digest = bytes.fromhex(signature_hex)
+        except ValueError:
+            provided_digest = b""
+        if algorithm != "sha256" or not provided_digest:
+            raise HTTPException(status_code=400, detail="Malformed signature")
+        mac = app.state.hmac_template.copy()
+    
+    # Read the payload once, hashing each chunk as it arrives
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > MAX_WEBHOOK_PAYLOAD:
+            raise HTTPException(status_code=413, detail="Payload too large")
+        if mac is not None:
+            mac.update(chunk)
+        chunks.append(chunk)
+    body = b"".join(chunks)
+    
+    # Verify webhook signature if secret is configured
+    if mac is not None:
+        if not hmac.compare_digest(provided_digest, mac.digest()):
             raise HTTPException(status_code=401, detail="Invalid signature")
     else:
         logger.warning("Webhook secret not configured - skipping signature verification")
     
-    # Process the webhook event
-    event_type = request.headers.get("X-GitHub-Event")
-    
-    # Check if this is an event type we're monitoring
-    event_types = (config.integrations.github.webhook_events 
-                  if config.integrations and config.integrations.github 
-                  else ["pull_request", "pull_request_review"])
-                  
-    if event_type not in event_types:
-        logger.info(f"Ignoring unhandled event type: {event_type}")
-        return {"status": "ignored"}
+    # Drop events from unmonitored repositories without parsing the payload;
+    # anything the scan cannot place is checked again after parsing
+    peeked = _REPO_FULL_NAME.search(body)
+    if peeked:
+        try:
+            repo_full_name = peeked.group(1).decode()
+        except UnicodeDecodeError:
+            # orjson rejects invalid UTF-8 as well
+            raise HTTPException(status_code=400, detail="Invalid JSON payload")
+        if repo_full_name not in app.state.repositories:
+            logger.info("Ignoring event from unmonitored repository: %s", repo_full_name)
+            return Response(_IGNORED_BODY, media_type="application/json")
     
     # Parse and handle the event
-    event_data = json.loads(body)
+    try:
+        event_data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
     
     # Check if this repository is being monitored
     if 'repository' in event_data:
         repo_full_name = event_data['repository']['full_name']
-        if repo_full_name not in config.repository_list:
-            logger.info(f"Ignoring event from unmonitored repository: {repo_full_name}")
-            return {"status": "ignored"}
+        if repo_full_name not in app.state.repositories:
+            logger.info("Ignoring event from unmonitored repository: %s", repo_full_name)
+            return Response(_IGNORED_BODY, media_type="application/json")
     
-    await agent.handle_github_event(event_type, event_data)
-    return {"status": "processing"}
+    try:
+        app.state.event_queue.put_nowait((event_type, event_data))
+    except asyncio.QueueFull:
+        raise HTTPException(status_code=503, detail="Event queue is full")
+    return Response(_PROCESSING_BODY, status_code=202, media_type="application/json")
 
 def main():
     """Main entry point."""
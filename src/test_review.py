@@ -19,29 +19,10 @@ def insecure_database_operation(user_input: str) -> List[Dict[str, Any]]:
     return cursor.fetchall()
 
 def complex_function(a: int, b: int, c: int, d: int, e: int, f: int) -> int:
-    """This function has complexity and maintainability issues."""
-    # Too many parameters and high cyclomatic complexity
-    result = 0
-    
-    # Nested conditions creating high cognitive complexity
-    if a > 0:
-        if b > 0:
-            if c > 0:
-                if d > 0:
-                    if e > 0:
-                        result = f
-                    else:
-                        result = e
-                else:
-                    result = d
-            else:
-                result = c
-        else:
-            result = b
-    else:
-        result = a
-        
-    return result
+    """This function has maintainability issues."""
+    # Too many parameters
+    # Returns the first non-positive argument, or f if all of a..e are positive
+    return next((value for value in (a, b, c, d, e) if value <= 0), f)
 
 class UtilityClass:
     """Class with multiple architectural and security issues."""
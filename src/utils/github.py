@@ -1,12 +1,283 @@
 """GitHub utilities for the PR Reviewer Agent."""
-from typing import Dict, List, Optional
+import asyncio
+import gzip
+import hashlib
+import sys
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
 import aiohttp
+import orjson
 from ..core.models import PRContext
 
+# Concurrent file downloads per PR, kept low for GitHub's secondary rate limit
+_MAX_CONCURRENT_FETCHES = 8
+
+# Retries of a rate-limited request, and the longest wait worth sleeping through
+_MAX_RATE_LIMIT_RETRIES = 3
+_MAX_RATE_LIMIT_WAIT = 300.0
+
+# Epoch time at which each host's exhausted rate limit resets
+_rate_limit_resets: Dict[str, float] = {}
+
+# Chunk size for streaming raw file contents
+_READ_CHUNK_SIZE = 64 * 1024
+
+# JSON bodies smaller than this are not worth gzipping
+_MIN_COMPRESS_SIZE = 1024
+
+# Memory taken by the parsed bodies in each response cache, and the largest
+# raw body worth keeping; bigger responses, typically raw file contents, are
+# not cached
+_RESPONSE_CACHE_BYTES = 32 * 1024 * 1024
+_MAX_CACHED_BODY = 1024 * 1024
+
+def _parsed_size(body: Any) -> int:
+    """Estimate the memory held by a parsed body and everything it contains."""
+    size = 0
+    pending = [body]
+    while pending:
+        value = pending.pop()
+        size += sys.getsizeof(value)
+        if isinstance(value, dict):
+            pending.extend(value.keys())
+            pending.extend(value.values())
+        elif isinstance(value, list):
+            pending.extend(value)
+    return size
+
+class _ResponseCache:
+    """LRU of parsed response bodies by request, bounded by their memory use."""
+
+    def __init__(self, max_bytes: int):
+        """Create an empty cache holding up to max_bytes of parsed bodies."""
+        self._entries: "OrderedDict[Tuple, Tuple[Any, Any, int]]" = OrderedDict()
+        self._max_bytes = max_bytes
+        self._size = 0
+
+    def get(self, key: Tuple) -> Optional[Tuple[Any, Any]]:
+        """Get the (validator, body) stored for a request, if any."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0], entry[1]
+
+    def put(self, key: Tuple, validator: Any, body: Any, raw_size: int) -> None:
+        """Store a response, evicting the least recently used ones over budget.
+
+        Args:
+            key: Request the response answers
+            validator: ETag or body digest to revalidate the response with
+            body: Parsed body
+            raw_size: Size of the body as received; responses larger than
+                _MAX_CACHED_BODY are not stored
+        """
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= old[2]
+        if raw_size > _MAX_CACHED_BODY:
+            return
+        size = _parsed_size(body)
+        self._entries[key] = (validator, body, size)
+        self._size += size
+        while self._size > self._max_bytes:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self._size -= evicted
+
+# Conditional GET responses as (ETag, body), and responses served without an
+# ETag as (body digest, body)
+_etag_cache = _ResponseCache(_RESPONSE_CACHE_BYTES)
+_body_hash_cache = _ResponseCache(_RESPONSE_CACHE_BYTES)
+
+def _github_headers(github_token: str) -> Dict[str, str]:
+    """Build the request headers for the GitHub REST API."""
+    return {
+        "Authorization": f"token {github_token}",
+        "Accept": "application/vnd.github.v3+json"
+    }
+
+def _rate_limit_delay(response: aiohttp.ClientResponse, attempt: int) -> Optional[float]:
+    """Get how long to wait before retrying a rate-limited response.
+
+    Args:
+        response: Response to inspect
+        attempt: Number of retries already made
+
+    Returns:
+        Seconds to wait, or None if the response was not rate limited
+    """
+    headers = response.headers
+    exhausted = headers.get("X-RateLimit-Remaining") == "0"
+    reset = headers.get("X-RateLimit-Reset", "")
+    if exhausted and reset.isdigit():
+        _rate_limit_resets[response.url.host] = float(reset)
+
+    if response.status not in (403, 429):
+        return None
+    retry_after = headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    if exhausted and reset.isdigit():
+        return max(float(reset) - time.time(), 0.0) + 1.0
+    if response.status == 429:
+        return float(2 ** attempt)
+    # A plain 403 is a permission problem, not a rate limit
+    return None
+
+@asynccontextmanager
+async def request(
+    session: aiohttp.ClientSession,
+    method: str,
+    url: str,
+    compress: bool = False,
+    **kwargs: Any
+) -> AsyncIterator[aiohttp.ClientResponse]:
+    """Send a request, waiting out GitHub rate limits instead of failing.
+
+    Requests to a host whose rate limit is known to be exhausted wait for
+    the reset first. Rate-limited responses (429, or 403 with Retry-After
+    or an exhausted X-RateLimit-Remaining) are retried after the indicated
+    delay; GitHub rejects those before processing, so this is safe for any
+    method. Waits longer than _MAX_RATE_LIMIT_WAIT are not slept through;
+    the response is handed to the caller instead.
+
+    Args:
+        session: aiohttp ClientSession
+        method: HTTP method
+        url: URL to request
+        compress: Gzip a json= body, for endpoints that accept
+            Content-Encoding: gzip
+        **kwargs: Passed on to session.request; a json= body is encoded
+            with orjson
+
+    Yields:
+        The final response
+    """
+    if "json" in kwargs:
+        body = orjson.dumps(kwargs.pop("json"))
+        headers = {**(kwargs.get("headers") or {}), "Content-Type": "application/json"}
+        if compress and len(body) >= _MIN_COMPRESS_SIZE:
+            # Level 1 is several times faster than the default and source
+            # code still shrinks to a fraction of its size
+            body = gzip.compress(body, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+        kwargs["data"] = body
+        kwargs["headers"] = headers
+
+    host = urlsplit(url).hostname
+    wait = _rate_limit_resets.get(host, 0.0) - time.time()
+    if 0 < wait <= _MAX_RATE_LIMIT_WAIT:
+        await asyncio.sleep(wait)
+
+    for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+        response = await session.request(method, url, **kwargs)
+        delay = _rate_limit_delay(response, attempt)
+        if delay is None or delay > _MAX_RATE_LIMIT_WAIT or attempt == _MAX_RATE_LIMIT_RETRIES:
+            break
+        response.release()
+        await asyncio.sleep(delay)
+
+    try:
+        yield response
+    finally:
+        response.release()
+
+async def read_json(response: aiohttp.ClientResponse) -> Any:
+    """Parse a JSON response body with orjson, straight from the raw bytes.
+
+    Args:
+        response: Response to read
+
+    Returns:
+        Parsed body, or None if the body is empty
+    """
+    body = await response.read()
+    return orjson.loads(body) if body else None
+
+async def _read_chunked(response: aiohttp.ClientResponse) -> bytearray:
+    """Read a possibly large response body in chunks.
+
+    The buffer is returned as is; copying it into bytes would double the
+    peak memory of a large file.
+    """
+    buffer = bytearray()
+    async for chunk in response.content.iter_chunked(_READ_CHUNK_SIZE):
+        buffer += chunk
+    return buffer
+
+def _decode_body(raw: Union[bytes, bytearray], as_text: bool) -> Any:
+    """Decode a raw body as UTF-8 text or parse it as JSON.
+
+    Undecodable bytes, e.g. in binary files, are replaced rather than
+    failing the whole PR fetch.
+    """
+    if as_text:
+        return raw.decode("utf-8", errors="replace")
+    return orjson.loads(raw) if raw else None
+
+async def conditional_get(
+    session: aiohttp.ClientSession,
+    url: str,
+    params: Optional[Dict[str, str]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    as_text: bool = False
+) -> Tuple[int, Any]:
+    """GET a URL, revalidating a previously seen response with its ETag.
+
+    GitHub answers 304 Not Modified for unchanged resources, which costs no
+    download or parsing and does not count against the primary rate limit.
+    Responses without an ETag are still downloaded, but a body identical to
+    the previous one, by BLAKE2 digest, reuses the earlier parsed result.
+
+    Args:
+        session: aiohttp ClientSession
+        url: URL to fetch
+        params: Optional query parameters
+        headers: Optional per-request headers, e.g. authentication
+        as_text: Return the body as text instead of parsed JSON
+
+    Returns:
+        Tuple of status and body. A 304 is reported as 200 with the cached
+        body; other error statuses come with the response text. Cached
+        bodies are shared between calls and must not be mutated.
+    """
+    request_headers = dict(headers) if headers else {}
+    # Responses are only reused for the credentials they were fetched with
+    auth = request_headers.get("Authorization") or session.headers.get("Authorization")
+    key = (url, tuple(sorted(params.items())) if params else (), as_text, auth)
+    cached = _etag_cache.get(key)
+    if cached:
+        request_headers["If-None-Match"] = cached[0]
+
+    async with request(session, "GET", url, params=params, headers=request_headers) as response:
+        if response.status == 304 and cached:
+            return 200, cached[1]
+        if response.status != 200:
+            return response.status, await response.text()
+
+        raw = await _read_chunked(response) if as_text else await response.read()
+        etag = response.headers.get("ETag")
+        if etag:
+            body = _decode_body(raw, as_text)
+            _etag_cache.put(key, etag, body, len(raw))
+            return 200, body
+
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        seen = _body_hash_cache.get(key)
+        if seen and seen[0] == digest:
+            return 200, seen[1]
+        body = _decode_body(raw, as_text)
+        _body_hash_cache.put(key, digest, body, len(raw))
+        return 200, body
+
 async def fetch_pr_details(
     repo: str,
     pr_number: int,
-    github_token: str
+    github_token: str,
+    session: Optional[aiohttp.ClientSession] = None
 ) -> PRContext:
     """Fetch pull request details from GitHub.
 
@@ -14,45 +285,57 @@ async def fetch_pr_details(
         repo: Repository name in format 'owner/repo'
         pr_number: Pull request number
         github_token: GitHub authentication token
+        session: Optional shared session to reuse pooled connections; a
+            temporary one is created when omitted
 
     Returns:
         PRContext object with PR details
     """
-    headers = {
-        "Authorization": f"token {github_token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await fetch_pr_details(repo, pr_number, github_token, session)
+
+    headers = _github_headers(github_token)
     
-    async with aiohttp.ClientSession(headers=headers) as session:
-        # Fetch PR metadata
-        pr_url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}"
-        async with session.get(pr_url) as response:
-            pr_data = await response.json()
-        
-        # Fetch PR files
-        files_url = f"{pr_url}/files"
-        async with session.get(files_url) as response:
-            files_data = await response.json()
-
-        return PRContext(
-            pr_number=pr_number,
-            repository=repo,
-            base_branch=pr_data["base"]["ref"],
-            head_branch=pr_data["head"]["ref"],
-            files_changed=[f["filename"] for f in files_data],
-            diff_content={
-                f["filename"]: await fetch_file_content(session, repo, f["raw_url"])
-                for f in files_data
-            },
-            author=pr_data["user"]["login"],
-            title=pr_data["title"],
-            description=pr_data["body"]
-        )
+    # Fetch PR metadata
+    pr_url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}"
+    status, pr_data = await conditional_get(session, pr_url, headers=headers)
+    if status != 200:
+        raise Exception(f"Failed to fetch PR details: {pr_data}")
+    
+    # Fetch PR files
+    files_url = f"{pr_url}/files"
+    status, files_data = await conditional_get(session, files_url, headers=headers)
+    if status != 200:
+        raise Exception(f"Failed to fetch PR files: {files_data}")
+
+    # Fetch file contents concurrently on the shared connection pool
+    slots = asyncio.Semaphore(_MAX_CONCURRENT_FETCHES)
+
+    async def fetch(raw_url: str) -> str:
+        async with slots:
+            return await fetch_file_content(session, repo, raw_url, headers)
+
+    filenames = [f["filename"] for f in files_data]
+    contents = await asyncio.gather(*(fetch(f["raw_url"]) for f in files_data))
+
+    return PRContext(
+        pr_number=pr_number,
+        repository=repo,
+        base_branch=pr_data["base"]["ref"],
+        head_branch=pr_data["head"]["ref"],
+        files_changed=filenames,
+        diff_content=dict(zip(filenames, contents)),
+        author=pr_data["user"]["login"],
+        title=pr_data["title"],
+        description=pr_data["body"]
+    )
 
 async def fetch_file_content(
     session: aiohttp.ClientSession,
     repo: str,
-    raw_url: str
+    raw_url: str,
+    headers: Optional[Dict[str, str]] = None
 ) -> str:
     """Fetch file content from GitHub.
 
@@ -60,12 +343,13 @@ async def fetch_file_content(
         session: aiohttp ClientSession
         repo: Repository name
         raw_url: URL to raw file content
+        headers: Optional per-request headers, e.g. authentication
 
     Returns:
         File content as string
     """
-    async with session.get(raw_url) as response:
-        return await response.text()
+    _, content = await conditional_get(session, raw_url, headers=headers, as_text=True)
+    return content
 
 async def post_review_comment(
     repo: str,
@@ -74,7 +358,8 @@ async def post_review_comment(
     body: str,
     commit_id: Optional[str] = None,
     path: Optional[str] = None,
-    line: Optional[int] = None
+    line: Optional[int] = None,
+    session: Optional[aiohttp.ClientSession] = None
 ) -> None:
     """Post a review comment on a pull request.
 
@@ -86,11 +371,16 @@ async def post_review_comment(
         commit_id: Optional commit SHA
         path: Optional file path for line comments
         line: Optional line number for line comments
+        session: Optional shared session to reuse pooled connections; a
+            temporary one is created when omitted
     """
-    headers = {
-        "Authorization": f"token {github_token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await post_review_comment(
+                repo, pr_number, github_token, body, commit_id, path, line, session
+            )
+
+    headers = _github_headers(github_token)
     
     url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}/reviews"
     
@@ -112,8 +402,7 @@ async def post_review_comment(
     if commit_id:
         review_data["commit_id"] = commit_id
     
-    async with aiohttp.ClientSession(headers=headers) as session:
-        async with session.post(url, json=review_data) as response:
-            if response.status not in (200, 201):
-                response_data = await response.json()
-                raise Exception(f"Failed to post review: {response_data}")
\ No newline at end of file
+    async with request(session, "POST", url, json=review_data, headers=headers) as response:
+        if response.status not in (200, 201):
+            response_data = await read_json(response)
+            raise Exception(f"Failed to post review: {response_data}")
\ No newline at end of file
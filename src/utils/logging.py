@@ -1,8 +1,14 @@
 """Logging utilities for the PR Reviewer Agent."""
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
+# Background thread writing queued log records to the real handlers
+_listener: Optional[QueueListener] = None
+
 def setup_logging(
     log_level: str = "INFO",
     log_file: Optional[Path] = None,
@@ -10,6 +16,10 @@ def setup_logging(
 ) -> None:
     """Setup logging configuration for the application.
 
+    Loggers only enqueue records; a background listener thread does the
+    console and file I/O, so logging from coroutines never blocks the
+    event loop on a write.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Path to log file. If None, logs to console only
@@ -20,19 +30,48 @@ def setup_logging(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
 
+    global _listener
+
+    formatter = logging.Formatter(format_string)
+    handlers = [
+        logging.StreamHandler(),
+        *(
+            [logging.FileHandler(log_file)]
+            if log_file
+            else []
+        )
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Stop a listener from an earlier call and close its file handles
+    stop_logging()
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    # The listener's handlers apply the real format; the queue side only
+    # renders the message so records can be handed across threads. force
+    # replaces the QueueHandler of an earlier call, whose queue is no
+    # longer drained
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
-        format=format_string,
-        handlers=[
-            logging.StreamHandler(),
-            *(
-                [logging.FileHandler(log_file)]
-                if log_file
-                else []
-            )
-        ]
+        handlers=[queue_handler],
+        force=True
     )
 
+@atexit.register
+def stop_logging() -> None:
+    """Flush queued log records and stop the background listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance with the given name.
 
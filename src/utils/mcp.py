@@ -1,11 +1,16 @@
 """MCP (Model Context Protocol) client implementation for GitHub PR reviews."""
 from typing import Dict, List, Optional, Any
+import asyncio
 import aiohttp
 import logging
 from src.core.models import PRContext, Issue
+from src.utils.github import conditional_get, read_json, request
 
 logger = logging.getLogger(__name__)
 
+# Repositories polled at once, kept low for GitHub's secondary rate limit
+_MAX_CONCURRENT_REPO_QUERIES = 10
+
 class MCPClient:
     """Client for interacting with GitHub through MCP."""
 
@@ -19,12 +24,41 @@ class MCPClient:
         """
         self.base_url = base_url.rstrip('/')
         self.github_api_url = github_api_url.rstrip('/')
+        # Fixed MCP endpoints, formatted once
+        self._analyze_pr_url = f"{self.base_url}/analyze/pr"
+        self._file_context_url = f"{self.base_url}/context/file"
+        self._validate_architecture_url = f"{self.base_url}/validate/architecture"
         self.headers = {
             "Authorization": f"Bearer {github_token}",  # GitHub API v3 format
             "Accept": "application/vnd.github.v3+json",  # Explicit GitHub API version
             "X-GitHub-Api-Version": "2022-11-28",  # GitHub API version date
             "Content-Type": "application/json"
         }
+        # Shared across calls so connections and DNS lookups are reused
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "MCPClient":
+        """Use the client as an async context manager that closes its session."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the shared session on exit."""
+        await self.close()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=75)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def analyze_pull_request(self, pr_context: PRContext) -> List[Issue]:
         """Analyze a pull request using MCP.
@@ -35,24 +69,25 @@ class MCPClient:
         Returns:
             List of issues found in the PR
         """
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            # MCP endpoint for PR analysis
-            url = f"{self.base_url}/analyze/pr"
-            
-            # Prepare PR data for MCP
-            pr_data = {
-                "repository": pr_context.repository,
-                "pull_request": pr_context.pr_number,
-                "files": pr_context.files_changed,
-                "diff_content": pr_context.diff_content
-            }
+        session = await self._get_session()
+        # MCP endpoint for PR analysis
+        url = self._analyze_pr_url
+        
+        # Prepare PR data for MCP
+        pr_data = {
+            "repository": pr_context.repository,
+            "pull_request": pr_context.pr_number,
+            "files": pr_context.files_changed,
+            "diff_content": pr_context.diff_content
+        }
+        
+        # Diff contents are large and compress well
+        async with request(session, "POST", url, compress=True, json=pr_data) as response:
+            if response.status != 200:
+                raise Exception(f"MCP request failed: {await response.text()}")
             
-            async with session.post(url, json=pr_data) as response:
-                if response.status != 200:
-                    raise Exception(f"MCP request failed: {await response.text()}")
-                
-                result = await response.json()
-                return self._convert_mcp_results(result)
+            result = await read_json(response)
+            return self._convert_mcp_results(result)
 
     async def get_file_context(self, file_path: str, repository: str) -> Dict[str, Any]:
         """Get file context information through MCP.
@@ -64,19 +99,19 @@ class MCPClient:
         Returns:
             File context information
         """
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            url = f"{self.base_url}/context/file"
-            
-            params = {
-                "path": file_path,
-                "repository": repository
-            }
+        session = await self._get_session()
+        url = self._file_context_url
+        
+        params = {
+            "path": file_path,
+            "repository": repository
+        }
+        
+        async with request(session, "GET", url, params=params) as response:
+            if response.status != 200:
+                raise Exception(f"MCP file context request failed: {await response.text()}")
             
-            async with session.get(url, params=params) as response:
-                if response.status != 200:
-                    raise Exception(f"MCP file context request failed: {await response.text()}")
-                
-                return await response.json()
+            return await read_json(response)
 
     def _convert_mcp_results(self, mcp_results: Dict[str, Any]) -> List[Issue]:
         """Convert MCP analysis results to internal Issue format.
@@ -103,45 +138,79 @@ class MCPClient:
     async def get_pending_reviews(self, repositories: List[str]) -> List[Dict[str, Any]]:
         """Get list of PRs pending review from specified repositories.
         
+        Repositories are queried concurrently. A repository that fails is
+        logged and skipped; the error is only raised if every one failed.
+        
         Args:
             repositories: List of repository identifiers to check
             
         Returns:
             List of PR information dictionaries
         """
+        session = await self._get_session()
+        slots = asyncio.Semaphore(_MAX_CONCURRENT_REPO_QUERIES)
+        
+        async def fetch(repo: str) -> List[Dict[str, Any]]:
+            async with slots:
+                return await self._fetch_repo_pulls(session, repo)
+        
+        results = await asyncio.gather(
+            *(fetch(repo) for repo in repositories),
+            return_exceptions=True
+        )
+        
         all_prs = []
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            for repo in repositories:
-                # Use GitHub's API directly to get pull requests
-                url = f"{self.github_api_url}/repos/{repo}/pulls"
-                params = {
-                    "state": "open",
-                    "sort": "updated",
-                    "direction": "desc"
-                }
-                
-                async with session.get(url, params=params) as response:
-                    if response.status == 404:
-                        logger.warning(f"Repository not found or no access: {repo}")
-                        continue
-                    elif response.status != 200:
-                        text = await response.text()
-                        raise Exception(f"Failed to get pending reviews for {repo}: {text}")
-                    
-                    prs = await response.json()
-                    for pr in prs:
-                        all_prs.append({
-                            "number": pr["number"],
-                            "repository": repo,
-                            "title": pr["title"],
-                            "url": pr["html_url"],
-                            "author": pr["user"]["login"],
-                            "created_at": pr["created_at"],
-                            "updated_at": pr["updated_at"]
-                        })
+        errors = []
+        for repo, result in zip(repositories, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting pending reviews for {repo}: {result}")
+                errors.append(result)
+            else:
+                all_prs.extend(result)
         
+        if errors and len(errors) == len(repositories):
+            raise errors[0]
         return all_prs
 
+    async def _fetch_repo_pulls(self, session: aiohttp.ClientSession, repo: str) -> List[Dict[str, Any]]:
+        """Get the open PRs of a single repository.
+        
+        Args:
+            session: Shared HTTP session
+            repo: Repository identifier
+            
+        Returns:
+            List of PR information dictionaries, empty if the repository is not accessible
+        """
+        # Use GitHub's API directly to get pull requests
+        url = f"{self.github_api_url}/repos/{repo}/pulls"
+        params = {
+            "state": "open",
+            "sort": "updated",
+            "direction": "desc"
+        }
+        
+        # Unchanged PR lists come back as cheap 304s between polls
+        status, prs = await conditional_get(session, url, params=params)
+        if status == 404:
+            logger.warning(f"Repository not found or no access: {repo}")
+            return []
+        elif status != 200:
+            raise Exception(f"Failed to get pending reviews for {repo}: {prs}")
+        
+        return [
+            {
+                "number": pr["number"],
+                "repository": repo,
+                "title": pr["title"],
+                "url": pr["html_url"],
+                "author": pr["user"]["login"],
+                "created_at": pr["created_at"],
+                "updated_at": pr["updated_at"]
+            }
+            for pr in prs
+        ]
+
     async def get_pr_context(self, pr_info: Dict[str, Any]) -> PRContext:
         """Get detailed context information for a specific PR.
         
@@ -151,25 +220,24 @@ class MCPClient:
         Returns:
             PRContext object with detailed PR information
         """
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            url = f"{self.base_url}/pr/{pr_info['repository']}/{pr_info['number']}/context"
-            
-            async with session.get(url) as response:
-                if response.status != 200:
-                    raise Exception(f"Failed to get PR context: {await response.text()}")
-                
-                result = await response.json()
-                return PRContext(
-                    pr_number=result["number"],
-                    repository=result["repository"],
-                    base_branch=result["base_branch"],
-                    head_branch=result["head_branch"],
-                    files_changed=result["files_changed"],
-                    diff_content=result["diff_content"],
-                    author=result["author"],
-                    title=result["title"],
-                    description=result.get("description")
-                )
+        session = await self._get_session()
+        url = f"{self.base_url}/pr/{pr_info['repository']}/{pr_info['number']}/context"
+        
+        status, result = await conditional_get(session, url)
+        if status != 200:
+            raise Exception(f"Failed to get PR context: {result}")
+        
+        return PRContext(
+            pr_number=result["number"],
+            repository=result["repository"],
+            base_branch=result["base_branch"],
+            head_branch=result["head_branch"],
+            files_changed=result["files_changed"],
+            diff_content=result["diff_content"],
+            author=result["author"],
+            title=result["title"],
+            description=result.get("description")
+        )
 
     async def post_review(self, repository: str, pr_number: int, review_result: Any) -> None:
         """Post a review to a pull request.
@@ -179,18 +247,18 @@ class MCPClient:
             pr_number: Pull request number
             review_result: Review result to post
         """
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            url = f"{self.base_url}/pr/{repository}/{pr_number}/review"
-            
-            review_data = {
-                "issues": [issue.dict() for issue in review_result.issues],
-                "summary": review_result.summary,
-                "stats": review_result.stats
-            }
-            
-            async with session.post(url, json=review_data) as response:
-                if response.status != 200:
-                    raise Exception(f"Failed to post review: {await response.text()}")
+        session = await self._get_session()
+        url = f"{self.base_url}/pr/{repository}/{pr_number}/review"
+        
+        review_data = {
+            "issues": [issue.dict() for issue in review_result.issues],
+            "summary": review_result.summary,
+            "stats": review_result.stats
+        }
+        
+        async with request(session, "POST", url, json=review_data) as response:
+            if response.status != 200:
+                raise Exception(f"Failed to post review: {await response.text()}")
 
     async def validate_architecture(self, 
                                  file_path: str, 
@@ -206,17 +274,17 @@ class MCPClient:
         Returns:
             List of architecture issues found
         """
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            url = f"{self.base_url}/validate/architecture"
-            
-            data = {
-                "file_path": file_path,
-                "content": content,
-                "rules": rules
-            }
+        session = await self._get_session()
+        url = self._validate_architecture_url
+        
+        data = {
+            "file_path": file_path,
+            "content": content,
+            "rules": rules
+        }
+        
+        async with request(session, "POST", url, compress=True, json=data) as response:
+            if response.status != 200:
+                raise Exception(f"MCP architecture validation failed: {await response.text()}")
             
-            async with session.post(url, json=data) as response:
-                if response.status != 200:
-                    raise Exception(f"MCP architecture validation failed: {await response.text()}")
-                
-                return self._convert_mcp_results(await response.json())
\ No newline at end of file
+            return self._convert_mcp_results(await read_json(response))
\ No newline at end of file
@@ -1,26 +1,103 @@
 """Metrics and monitoring utilities for the PR Reviewer Agent."""
 import time
+from array import array
+from bisect import bisect_left
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from functools import partial
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Shared read-only tags for untagged points
+_EMPTY_TAGS: Mapping[str, str] = MappingProxyType({})
+
+@dataclass(slots=True)
 class MetricPoint:
     """A single metric measurement."""
-    timestamp: float
+    timestamp: int  # time.monotonic_ns() at recording
     value: float
-    tags: Dict[str, str] = field(default_factory=dict)
+    tags: Mapping[str, str] = field(default_factory=lambda: _EMPTY_TAGS)
+
+class MetricSeries:
+    """Measurements of one metric, stored column-wise.
+
+    Timestamps (monotonic nanoseconds) and values live in flat typed arrays
+    rather than one object per point; tags are only kept once a tagged
+    point is recorded.
+
+    The series is bounded: once it grows an eighth past its capacity, the
+    oldest points are dropped so the most recent `capacity` remain. Old
+    points are thus forgotten in exchange for constant memory; trimming in
+    batches keeps the amortized cost per point O(1).
+    """
+
+    __slots__ = ("capacity", "timestamps", "values", "tags", "total")
+
+    def __init__(self, capacity: int):
+        """Initialize an empty series.
+
+        Args:
+            capacity: Number of most recent points to retain
+        """
+        self.capacity = capacity
+        self.timestamps = array("q")
+        self.values = array("d")
+        self.tags: Optional[List[Mapping[str, str]]] = None
+        # Running sum of values, so summaries need not re-add the series
+        self.total = 0.0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, timestamp: int, value: float, tags: Optional[Dict[str, str]]) -> None:
+        """Append a measurement.
+
+        Args:
+            timestamp: time.monotonic_ns() of the measurement
+            value: Measured value
+            tags: Optional tags for the measurement
+        """
+        if tags and self.tags is None:
+            self.tags = [_EMPTY_TAGS] * len(self.values)
+        self.timestamps.append(timestamp)
+        self.values.append(value)
+        self.total += value
+        if self.tags is not None:
+            self.tags.append(tags or _EMPTY_TAGS)
+
+        excess = len(self.values) - self.capacity
+        if excess > self.capacity // 8:
+            del self.timestamps[:excess]
+            del self.values[:excess]
+            if self.tags is not None:
+                del self.tags[:excess]
+            # Re-add rather than subtract, so rounding error cannot accumulate
+            self.total = sum(self.values)
+
+    def points(self) -> List[MetricPoint]:
+        """Get the measurements as MetricPoint objects."""
+        tags = self.tags if self.tags is not None else [_EMPTY_TAGS] * len(self.values)
+        return [
+            MetricPoint(timestamp=ts, value=value, tags=point_tags)
+            for ts, value, point_tags in zip(self.timestamps, self.values, tags)
+        ]
 
 class MetricsCollector:
     """Collect and manage metrics for the agent."""
     
-    def __init__(self):
-        """Initialize the metrics collector."""
-        self.metrics: Dict[str, List[MetricPoint]] = defaultdict(list)
-        self.timers: Dict[str, float] = {}
+    def __init__(self, max_points_per_metric: int = 100_000):
+        """Initialize the metrics collector.
+
+        Args:
+            max_points_per_metric: Number of most recent points kept per metric
+        """
+        self.metrics: Dict[str, MetricSeries] = defaultdict(
+            partial(MetricSeries, max_points_per_metric)
+        )
+        self.timers: Dict[str, int] = {}
 
     def record_metric(
         self,
@@ -35,13 +112,7 @@ class MetricsCollector:
             value: Metric value
             tags: Optional tags for the metric
         """
-        self.metrics[name].append(
-            MetricPoint(
-                timestamp=time.time(),
-                value=value,
-                tags=tags or {}
-            )
-        )
+        self.metrics[name].append(time.monotonic_ns(), value, tags)
 
     def start_timer(self, name: str) -> None:
         """Start a timer for a named operation.
@@ -49,7 +120,7 @@ class MetricsCollector:
         Args:
             name: Timer name
         """
-        self.timers[name] = time.time()
+        self.timers[name] = time.monotonic_ns()
 
     def stop_timer(self, name: str) -> Optional[float]:
         """Stop a timer and record its duration.
@@ -65,10 +136,22 @@ class MetricsCollector:
             logger.warning(f"No timer found with name: {name}")
             return None
 
-        duration = time.time() - start_time
+        duration = (time.monotonic_ns() - start_time) / 1e9
         self.record_metric(f"{name}_duration", duration)
         return duration
 
+    def get_points(self, name: str) -> List[MetricPoint]:
+        """Get the recorded measurements of a metric.
+
+        Args:
+            name: Metric name
+
+        Returns:
+            List of metric points, oldest first
+        """
+        series = self.metrics.get(name)
+        return series.points() if series else []
+
     def get_metric_average(
         self,
         name: str,
@@ -83,18 +166,21 @@ class MetricsCollector:
         Returns:
             Average value or None if no data
         """
-        points = self.metrics.get(name, [])
-        if not points:
+        series = self.metrics.get(name)
+        if not series:
             return None
 
+        values = series.values
         if window_seconds:
-            cutoff = time.time() - window_seconds
-            points = [p for p in points if p.timestamp >= cutoff]
+            # Timestamps are appended in monotonic order, so the window is a suffix
+            cutoff = time.monotonic_ns() - int(window_seconds * 1e9)
+            start = bisect_left(series.timestamps, cutoff)
+            values = memoryview(values)[start:]
 
-        if not points:
+        if not values:
             return None
 
-        return sum(p.value for p in points) / len(points)
+        return sum(values) / len(values)
 
     def get_metrics_summary(self) -> Dict[str, Dict]:
         """Get summary of all metrics.
@@ -103,14 +189,14 @@ class MetricsCollector:
             Dictionary with metric summaries
         """
         summary = {}
-        for name, points in self.metrics.items():
-            if not points:
+        for name, series in self.metrics.items():
+            if not series:
                 continue
 
-            values = [p.value for p in points]
+            values = series.values
             summary[name] = {
                 "count": len(values),
-                "average": sum(values) / len(values),
+                "average": series.total / len(values),
                 "min": min(values),
                 "max": max(values),
                 "latest": values[-1]
@@ -2,6 +2,15 @@
 import re
 from typing import List, Tuple
 
+_CODE_BLOCK = re.compile(r"```(\w+)?\n(.*?)```", re.DOTALL)
+
+_SEVERITY_EMOJI = {
+    "error": "🔴",
+    "warning": "🟡",
+    "info": "ℹ️",
+    "suggestion": "💡"
+}
+
 def extract_code_block(text: str) -> List[Tuple[str, str]]:
     """Extract code blocks and their language from text.
 
@@ -11,9 +20,10 @@ def extract_code_block(text: str) -> List[Tuple[str, str]]:
     Returns:
         List of tuples (language, code)
     """
-    pattern = r"```(\w+)?\n(.*?)```"
-    matches = re.finditer(pattern, text, re.DOTALL)
-    return [(m.group(1) or "", m.group(2).strip()) for m in matches]
+    # Most text has no fences; the substring check is far cheaper than a scan
+    if "```" not in text:
+        return []
+    return [(m.group(1) or "", m.group(2).strip()) for m in _CODE_BLOCK.finditer(text)]
 
 def format_issue_comment(
     severity: str,
@@ -32,24 +42,15 @@ def format_issue_comment(
     Returns:
         Formatted comment string
     """
-    emoji_map = {
-        "error": "🔴",
-        "warning": "🟡",
-        "info": "ℹ️",
-        "suggestion": "💡"
-    }
-
-    comment = [f"{emoji_map.get(severity.lower(), 'ℹ️')} **{severity.upper()}**: {message}"]
+    comment = f"{_SEVERITY_EMOJI.get(severity.lower(), 'ℹ️')} **{severity.upper()}**: {message}"
     
     if code_snippet:
-        comment.append("\nRelevant code:")
-        comment.append(f"```\n{code_snippet}\n```")
+        comment += f"\n\nRelevant code:\n```\n{code_snippet}\n```"
     
     if suggestion:
-        comment.append("\n💡 **Suggestion**:")
-        comment.append(suggestion)
+        comment += f"\n\n💡 **Suggestion**:\n{suggestion}"
     
-    return "\n".join(comment)
+    return comment
 
 def truncate_text(text: str, max_length: int = 1000) -> str:
     """Truncate text to specified length while keeping whole words.
@@ -64,5 +65,8 @@ def truncate_text(text: str, max_length: int = 1000) -> str:
     if len(text) <= max_length:
         return text
         
-    truncated = text[:max_length].rsplit(' ', 1)[0]
-    return f"{truncated}..."
\ No newline at end of file
+    # Find the last word boundary in place rather than slicing first
+    cut = text.rfind(' ', 0, max_length)
+    if cut < 0:
+        cut = max_length
+    return f"{text[:cut]}..."
\ No newline at end of file
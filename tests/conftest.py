@@ -0,0 +1,6 @@
+"""Shared test setup."""
+import os
+
+# src.main builds the agent, and with it the Azure OpenAI client, on import
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test-key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com/")
@@ -0,0 +1,115 @@
+"""Tests for the architecture analyzer."""
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from src.analyzers.architecture import ArchitectureAnalyzer
+from src.core.config import ArchitectureRules, DependencyRule, PatternViolation, load_config
+from src.core.models import PRContext
+
+def _analyzer(*patterns):
+    """Build an analyzer whose only rules are the given unscoped patterns."""
+    config = load_config()
+    architecture = ArchitectureRules(
+        layer_violations=[],
+        dependency_rules=[],
+        pattern_violations=[
+            PatternViolation(name=f"rule_{i}", pattern=pattern, message=f"Rule {i}")
+            for i, pattern in enumerate(patterns)
+        ]
+    )
+    rules = config.rules.model_copy(update={"architecture": architecture})
+    return ArchitectureAnalyzer(config.model_copy(update={"rules": rules}))
+
+def _findings(analyzer, files):
+    """Run the analyzer over files and reduce its issues to (path, line, rule)."""
+    context = PRContext(
+        pr_number=1,
+        repository="owner/repo",
+        base_branch="main",
+        head_branch="feature",
+        files_changed=list(files),
+        diff_content=files,
+        author="author",
+        title="Title",
+        description=None
+    )
+    issues = asyncio.run(analyzer.analyze(context))
+    return sorted((issue.file_path, issue.line_number, issue.rule_name) for issue in issues)
+
+def test_anchored_rules_match_at_line_boundaries():
+    analyzer = _analyzer(r"^\s*print\(", r"TODO$")
+    content = "x = 1\n    print(x)\n# TODO\n# TODO later\ny = print(x)\n"
+
+    assert _findings(analyzer, {"app.py": content}) == [
+        ("app.py", 2, "rule_0"),
+        ("app.py", 3, "rule_1"),
+    ]
+
+def test_rules_do_not_match_across_lines():
+    analyzer = _analyzer(r"new\s+[A-Z]\w*\(")
+    content = "a = new\n  Foo(1)\nb = new  Bar(2)\nc = new\nnew Baz(3)\n"
+
+    assert _findings(analyzer, {"app.js": content}) == [
+        ("app.js", 3, "rule_0"),
+        ("app.js", 5, "rule_0"),
+    ]
+
+def test_rules_with_duplicate_names_are_all_checked():
+    config = load_config()
+    architecture = ArchitectureRules(
+        layer_violations=[],
+        dependency_rules=[],
+        pattern_violations=[
+            PatternViolation(name="banned", pattern="eval", message="No eval"),
+            PatternViolation(name="banned", pattern="exec", message="No exec"),
+        ]
+    )
+    rules = config.rules.model_copy(update={"architecture": architecture})
+    analyzer = ArchitectureAnalyzer(config.model_copy(update={"rules": rules}))
+
+    assert _findings(analyzer, {"app.py": "eval(x)\nexec(y)\n"}) == [
+        ("app.py", 1, "banned"),
+        ("app.py", 2, "banned"),
+    ]
+
+def _scoped_analyzer(scope):
+    """Build an analyzer with a single rule limited to the given scope."""
+    config = load_config()
+    architecture = ArchitectureRules(
+        layer_violations=[],
+        dependency_rules=[
+            DependencyRule(name="scoped", pattern="eval", message="No eval", scope=scope)
+        ],
+        pattern_violations=[]
+    )
+    rules = config.rules.model_copy(update={"architecture": architecture})
+    return ArchitectureAnalyzer(config.model_copy(update={"rules": rules}))
+
+@pytest.mark.parametrize("scope, matched", [
+    # Globs match the whole path
+    ("*/controller/*", ["app/controller/user.py"]),
+    ("*.*", ["app/controller/user.py", "src/api/routes.py", "src/controllers/user.py"]),
+    ("src/api/*", ["src/api/routes.py"]),
+    # Regexes match from the start of the path
+    (r"src/.*\.py", ["src/api/routes.py", "src/controllers/user.py"]),
+    (".*/controller/", ["app/controller/user.py"]),
+    # Plain prefixes match everything below them
+    ("src/api/", ["src/api/routes.py"]),
+    ("src/controllers", ["src/controllers/user.py"]),
+])
+def test_rule_scopes(scope, matched):
+    files = {
+        "app/controller/user.py": "eval(x)\n",
+        "src/api/routes.py": "eval(x)\n",
+        "src/controllers/user.py": "eval(x)\n",
+    }
+
+    findings = _findings(_scoped_analyzer(scope), files)
+
+    assert [path for path, _, _ in findings] == matched
+
+def test_invalid_scope_fails_when_config_loads():
+    with pytest.raises(ValidationError, match="Invalid scope"):
+        DependencyRule(name="scoped", pattern="eval", message="No eval", scope="src/(api")
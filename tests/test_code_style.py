@@ -0,0 +1,77 @@
+"""Tests for the code style analyzer."""
+import asyncio
+
+import pytest
+
+from src.analyzers.code_style import CodeStyleAnalyzer
+from src.core.config import load_config
+from src.core.models import PRContext
+
+def _findings(file_path, content):
+    """Run the style analyzer over one file and reduce its issues to (line, rule, message)."""
+    context = PRContext(
+        pr_number=1,
+        repository="owner/repo",
+        base_branch="main",
+        head_branch="feature",
+        files_changed=[file_path],
+        diff_content={file_path: content},
+        author="author",
+        title="Title",
+        description=None
+    )
+    issues = asyncio.run(CodeStyleAnalyzer(load_config()).analyze(context))
+    return sorted((issue.line_number, issue.rule_name, issue.message) for issue in issues)
+
+def test_python_naming_conventions_are_checked_on_the_syntax_tree():
+    content = (
+        "class my_class:\n"
+        "    def DoThing(self):\n"
+        "        myValue = 1\n"
+        "        CONSTANT = 2\n"
+        "        snake_case = 3\n"
+        "\n"
+        "class _PrivateClass:\n"
+        "    def _helper(self):\n"
+        "        pass\n"
+    )
+
+    assert _findings("module.py", content) == [
+        (1, "naming_convention", "Invalid class name convention"),
+        (2, "naming_convention", "Invalid method name convention"),
+        (3, "naming_convention", "Invalid variable name convention"),
+    ]
+
+def test_long_python_method_is_reported_at_its_definition():
+    content = "def short():\n    pass\n\ndef long():\n" + "    x = 1\n" * 60
+
+    assert _findings("module.py", content) == [
+        (4, "max_method_length", "Method exceeds maximum length of 50 lines"),
+    ]
+
+def test_deeply_indented_lines_are_reported():
+    content = "def f():\n" + " " * 16 + "ok = 1\n" + " " * 20 + "too_deep = 1\n"
+
+    assert _findings("module.py", content) == [
+        (3, "max_nesting_depth", "Code nesting depth exceeds maximum of 4"),
+    ]
+
+def test_other_languages_use_the_regex_checks():
+    content = "class foo {}\nfunction DoIt() {}\nValue = 1\n"
+
+    assert _findings("module.js", content) == [
+        (1, "naming_convention", "Invalid class name convention"),
+        (2, "naming_convention", "Invalid method name convention"),
+        (3, "naming_convention", "Invalid variable name convention"),
+    ]
+
+@pytest.mark.parametrize("content", [
+    # Syntax error
+    "def Broken(:\n    Value = 1\n",
+    # Too deeply nested for the parser
+    "x = " + "a+" * 200000 + "a\nValue = 1\n",
+])
+def test_unparsable_python_falls_back_to_the_regex_checks(content):
+    findings = _findings("module.py", content)
+
+    assert (content.count("\n"), "naming_convention", "Invalid variable name convention") in findings
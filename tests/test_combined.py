@@ -0,0 +1,63 @@
+"""Tests for the combined single-pass analyzer."""
+import asyncio
+
+from src.analyzers.architecture import ArchitectureAnalyzer
+from src.analyzers.code_style import CodeStyleAnalyzer
+from src.analyzers.combined import CombinedAnalyzer
+from src.analyzers.security import SecurityAnalyzer
+from src.core.config import load_config
+from src.core.models import PRContext
+
+FILES = {
+    "app/controller/user.js": (
+        "let total = 1\n"
+        'Token = "abcdefghijkl"\n'
+        'Password = "abcdefghijkl"\n'
+        "repository.save(user)\n"
+        'Secret = "abcdefghijkl"\n'
+    ),
+    "app/core/service.py": (
+        "import os..x\n"
+        "DEBUG = True\n"
+        'password = "hunter2hunter2"\n'
+        'cursor.execute("select %s" + name)\n'
+        "class user_service:\n"
+        "    def Load(self):\n"
+        "        X = 1\n"
+    ),
+    "app/core/broken.py": "def Broken(:\n    Value = 1\n",
+}
+
+def _findings(analyzer, context):
+    """Run an analyzer and reduce its issues to comparable tuples."""
+    issues = asyncio.run(analyzer.analyze(context))
+    return sorted(
+        (issue.file_path, issue.line_number, issue.rule_name, issue.message, issue.code_snippet or "")
+        for issue in issues
+    )
+
+def test_combined_analyzer_matches_individual_analyzers():
+    config = load_config()
+    context = PRContext(
+        pr_number=1,
+        repository="owner/repo",
+        base_branch="main",
+        head_branch="feature",
+        files_changed=list(FILES),
+        diff_content=FILES,
+        author="author",
+        title="Title",
+        description=None
+    )
+
+    individual = sorted(
+        finding
+        for analyzer in (ArchitectureAnalyzer, SecurityAnalyzer, CodeStyleAnalyzer)
+        for finding in _findings(analyzer(config), context)
+    )
+    combined = _findings(CombinedAnalyzer(config), context)
+
+    assert combined == individual
+    # Style hits on the same offsets as hardcoded secrets are not shadowed
+    assert ("app/controller/user.js", 2, "naming_convention") in {f[:3] for f in combined}
+    assert ("app/controller/user.js", 2, "hardcoded_secret") in {f[:3] for f in combined}
@@ -0,0 +1,63 @@
+"""Tests for configuration loading."""
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+import yaml
+
+from src.core import config as config_module
+from src.core.config import load_config
+
+SETTINGS = Path(__file__).parent.parent / "config" / "settings.yaml"
+
+@pytest.fixture
+def settings_file(tmp_path, monkeypatch):
+    """Copy of the default settings, with empty config caches."""
+    monkeypatch.setattr(config_module, "_YAML_CACHE", {})
+    monkeypatch.setattr(config_module, "_COMPONENT_CACHE", {})
+    path = tmp_path / "settings.yaml"
+    shutil.copy(SETTINGS, path)
+    return path
+
+@pytest.fixture
+def yaml_loads(monkeypatch):
+    """Count the YAML documents parsed."""
+    calls = []
+    load = yaml.load
+
+    def counting_load(*args, **kwargs):
+        calls.append(args)
+        return load(*args, **kwargs)
+
+    monkeypatch.setattr(yaml, "load", counting_load)
+    return calls
+
+def test_unchanged_file_is_parsed_and_validated_once(settings_file, yaml_loads):
+    first = load_config(str(settings_file))
+    second = load_config(str(settings_file))
+
+    assert len(yaml_loads) == 1
+    assert second.rules is first.rules
+    assert second.rules.coding_standards.max_method_length == 50
+
+def test_edited_file_is_picked_up(settings_file, yaml_loads):
+    first = load_config(str(settings_file))
+
+    text = settings_file.read_text().replace("max_method_length: 50", "max_method_length: 80")
+    settings_file.write_text(text)
+    stat = settings_file.stat()
+    # Make sure the edit gets a new mtime even on coarse-grained filesystems
+    os.utime(settings_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = load_config(str(settings_file))
+
+    assert len(yaml_loads) == 2
+    assert first.rules.coding_standards.max_method_length == 50
+    assert second.rules.coding_standards.max_method_length == 80
+
+def test_cached_document_is_not_shared_with_callers(settings_file):
+    _, first = config_module._read_yaml(str(settings_file))
+    first["rules"]["coding_standards"]["max_method_length"] = 1
+    _, second = config_module._read_yaml(str(settings_file))
+
+    assert second["rules"]["coding_standards"]["max_method_length"] == 50
@@ -0,0 +1,188 @@
+"""Tests for the GitHub HTTP helpers."""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.utils import github
+from src.utils.github import _rate_limit_delay, _ResponseCache, conditional_get, request
+
+@pytest.fixture(autouse=True)
+def fresh_caches(monkeypatch):
+    """Give each test empty response caches and rate limit state."""
+    monkeypatch.setattr(github, "_etag_cache", _ResponseCache(github._RESPONSE_CACHE_BYTES))
+    monkeypatch.setattr(github, "_body_hash_cache", _ResponseCache(github._RESPONSE_CACHE_BYTES))
+    monkeypatch.setattr(github, "_rate_limit_resets", {})
+
+async def _serve(handler, check):
+    """Run check(session, url) against a local server answering with handler."""
+    app = web.Application()
+    app.router.add_get("/resource", handler)
+    async with TestServer(app) as server:
+        async with aiohttp.ClientSession() as session:
+            return await check(session, str(server.make_url("/resource")))
+
+def test_conditional_get_reuses_body_on_304():
+    seen = []
+
+    async def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response({"number": 1}, headers={"ETag": '"v1"'})
+
+    async def check(session, url):
+        return [await conditional_get(session, url) for _ in range(2)]
+
+    first, second = asyncio.run(_serve(handler, check))
+
+    assert first == (200, {"number": 1})
+    assert second[0] == 200
+    assert second[1] is first[1]
+    assert seen == [None, '"v1"']
+
+def test_conditional_get_does_not_share_entries_between_tokens():
+    seen = []
+
+    async def handler(request):
+        token = request.headers["Authorization"]
+        seen.append((token, request.headers.get("If-None-Match")))
+        if request.headers.get("If-None-Match") == f'"{token}"':
+            return web.Response(status=304)
+        return web.json_response({"token": token}, headers={"ETag": f'"{token}"'})
+
+    async def check(session, url):
+        return [
+            await conditional_get(session, url, headers={"Authorization": token})
+            for token in ("token a", "token b", "token a")
+        ]
+
+    results = asyncio.run(_serve(handler, check))
+
+    assert [body for _, body in results] == [
+        {"token": "token a"},
+        {"token": "token b"},
+        {"token": "token a"},
+    ]
+    assert seen == [("token a", None), ("token b", None), ("token a", '"token a"')]
+
+def test_conditional_get_reuses_identical_body_without_etag():
+    bodies = iter([b'{"v": 1}', b'{"v": 1}', b'{"v": 2}'])
+
+    async def handler(request):
+        return web.Response(body=next(bodies), content_type="application/json")
+
+    async def check(session, url):
+        return [await conditional_get(session, url) for _ in range(3)]
+
+    first, second, third = asyncio.run(_serve(handler, check))
+
+    assert second[1] is first[1]
+    assert third == (200, {"v": 2})
+
+def test_response_cache_skips_bodies_over_the_entry_limit():
+    cache = _ResponseCache(github._RESPONSE_CACHE_BYTES)
+    cache.put("small", "etag", "x", raw_size=1)
+    cache.put("large", "etag", "x", raw_size=github._MAX_CACHED_BODY + 1)
+
+    assert cache.get("small") == ("etag", "x")
+    assert cache.get("large") is None
+
+def test_response_cache_evicts_least_recently_used_over_budget():
+    body = "x" * 1000
+    entry_size = github._parsed_size(body)
+    cache = _ResponseCache(entry_size * 2)
+    cache.put("a", "etag", body, raw_size=1000)
+    cache.put("b", "etag", body, raw_size=1000)
+    cache.get("a")
+    cache.put("c", "etag", body, raw_size=1000)
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+def test_response_cache_budgets_parsed_size():
+    body = [{"filename": f"src/file_{i}.py", "additions": i} for i in range(100)]
+    raw_size = len(str(body))
+
+    assert github._parsed_size(body) > raw_size
+    cache = _ResponseCache(raw_size)
+    cache.put("files", "etag", body, raw_size=raw_size)
+    assert cache.get("files") is None
+
+def _response(status, **headers):
+    """Build a stand-in response carrying only what the rate limit check reads."""
+    return SimpleNamespace(status=status, headers=headers, url=SimpleNamespace(host="api.github.com"))
+
+def test_rate_limit_delay_prefers_retry_after():
+    response = _response(429, **{"Retry-After": "7", "X-RateLimit-Remaining": "0"})
+
+    assert _rate_limit_delay(response, attempt=0) == 7.0
+
+def test_rate_limit_delay_waits_for_reset_when_exhausted():
+    reset = int(time.time()) + 30
+    response = _response(403, **{"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)})
+
+    delay = _rate_limit_delay(response, attempt=0)
+
+    assert 29 <= delay <= 32
+    assert github._rate_limit_resets["api.github.com"] == reset
+
+def test_rate_limit_delay_backs_off_on_bare_429():
+    assert [_rate_limit_delay(_response(429), attempt) for attempt in range(3)] == [1.0, 2.0, 4.0]
+
+def test_rate_limit_delay_ignores_permission_errors():
+    assert _rate_limit_delay(_response(403), attempt=0) is None
+    assert _rate_limit_delay(_response(200), attempt=0) is None
+
+def _status_sequence(*responses):
+    """Build a handler answering successive requests with (status, headers) pairs."""
+    pending = iter(responses)
+    calls = []
+
+    async def handler(request):
+        status, headers = next(pending)
+        calls.append(status)
+        return web.Response(status=status, headers=headers)
+
+    return handler, calls
+
+async def _final_status(session, url):
+    """Send a request through the rate limit aware helper."""
+    async with request(session, "GET", url) as response:
+        return response.status
+
+def test_request_retries_rate_limited_responses():
+    handler, calls = _status_sequence(
+        (429, {"Retry-After": "0"}),
+        (403, {"Retry-After": "0"}),
+        (200, {}),
+    )
+
+    assert asyncio.run(_serve(handler, _final_status)) == 200
+    assert calls == [429, 403, 200]
+
+def test_request_gives_up_after_last_retry():
+    handler, calls = _status_sequence(
+        *[(429, {"Retry-After": "0"})] * (github._MAX_RATE_LIMIT_RETRIES + 2)
+    )
+
+    assert asyncio.run(_serve(handler, _final_status)) == 429
+    assert len(calls) == github._MAX_RATE_LIMIT_RETRIES + 1
+
+def test_request_returns_waits_longer_than_the_limit():
+    too_long = str(int(github._MAX_RATE_LIMIT_WAIT) + 60)
+    handler, calls = _status_sequence((429, {"Retry-After": too_long}), (200, {}))
+
+    assert asyncio.run(_serve(handler, _final_status)) == 429
+    assert calls == [429]
+
+def test_request_does_not_retry_permission_errors():
+    handler, calls = _status_sequence((403, {}), (200, {}))
+
+    assert asyncio.run(_serve(handler, _final_status)) == 403
+    assert calls == [403]
@@ -0,0 +1,99 @@
+"""Tests for the GitHub webhook endpoint."""
+import hashlib
+import hmac
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from src import main
+
+SECRET = b"webhook-secret"
+
+PAYLOAD = orjson.dumps({
+    "action": "opened",
+    "repository": {"full_name": "owner/repo"},
+    "pull_request": {"number": 1},
+})
+
+def _signature(body, secret=SECRET):
+    """Sign a body the way GitHub does."""
+    return "sha256=" + hmac.new(secret, body, hashlib.sha256).hexdigest()
+
+@pytest.fixture
+def client(monkeypatch):
+    """Client for the app with a webhook secret and no agent work behind it."""
+    async def start():
+        pass
+
+    async def handle_batch(batch):
+        pass
+
+    monkeypatch.setattr(main.agent, "start", start)
+    monkeypatch.setattr(main.agent, "handle_github_events_batch", handle_batch)
+    with TestClient(main.app) as client:
+        main.app.state.hmac_template = hmac.new(SECRET, digestmod=hashlib.sha256)
+        main.app.state.repositories = frozenset({"owner/repo"})
+        yield client
+
+def _post(client, body, signature=None, event="pull_request"):
+    """Post a webhook delivery."""
+    headers = {"X-GitHub-Event": event, "Content-Type": "application/json"}
+    if signature is not None:
+        headers["X-Hub-Signature-256"] = signature
+    return client.post("/webhook", content=body, headers=headers)
+
+def test_valid_signature_is_accepted(client):
+    response = _post(client, PAYLOAD, _signature(PAYLOAD))
+
+    assert response.status_code == 202
+    assert response.json() == {"status": "processing"}
+
+def test_invalid_signature_is_rejected(client):
+    response = _post(client, PAYLOAD, _signature(PAYLOAD, b"other-secret"))
+
+    assert response.status_code == 401
+
+def test_tampered_body_is_rejected(client):
+    response = _post(client, PAYLOAD + b" ", _signature(PAYLOAD))
+
+    assert response.status_code == 401
+
+@pytest.mark.parametrize("signature", [
+    None,
+    "sha1=" + hmac.new(SECRET, PAYLOAD, hashlib.sha1).hexdigest(),
+    "sha256=not-hex",
+    "sha256=",
+])
+def test_missing_or_malformed_signature_is_rejected(client, signature):
+    response = _post(client, PAYLOAD, signature)
+
+    assert response.status_code == 400
+
+def test_oversized_payload_is_rejected(client, monkeypatch):
+    monkeypatch.setattr(main, "MAX_WEBHOOK_PAYLOAD", len(PAYLOAD) - 1)
+
+    response = _post(client, PAYLOAD, _signature(PAYLOAD))
+
+    assert response.status_code == 413
+
+def test_unhandled_event_type_is_ignored(client):
+    response = _post(client, PAYLOAD, event="star")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ignored"}
+
+def test_unmonitored_repository_is_ignored(client):
+    body = PAYLOAD.replace(b"owner/repo", b"other/repo")
+
+    response = _post(client, body, _signature(body))
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ignored"}
+
+def test_undecodable_repository_name_is_rejected(client):
+    body = PAYLOAD.replace(b"owner/repo", b"owner/\xff")
+
+    response = _post(client, body, _signature(body))
+
+    assert response.status_code == 400